@@ -1,14 +1,27 @@
 import traceback
 import os, sys, json, shutil, zipfile, threading
-import urllib.request
+import functools
+import urllib.parse
 import urllib.error
+import http.client
+import contextlib
 import ssl
+import sqlite3
+import time
+import socket
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
 import subprocess
 import uuid as uuidlib
 import platform
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import itertools
+try:
+    import orjson  # Optional: much faster parsing of asset indexes and version JSONs
+except ImportError:
+    orjson = None
 
 # --- Constants ---
 USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/102.0.0.0 Safari/537.36"
@@ -25,7 +38,8 @@ def get_ssl_context(verify=False):
     return ctx
 
 # --- Directory Setup ---
-mc_dir = os.path.expanduser("~/Library/Application Support/minecraft")
+# Absolute once here, so paths joined from these never need os.path.abspath
+mc_dir = os.path.abspath(os.path.expanduser("~/Library/Application Support/minecraft"))
 if not os.path.isdir(mc_dir):
     os.makedirs(mc_dir, exist_ok=True)
 
@@ -57,19 +71,25 @@ if os.path.isfile(accounts_file):
         accounts = []
 
 def save_accounts():
+    # Write a temp file and rename it, so a crash never leaves a half-written file
+    tmp_path = accounts_file + ".tmp"
     try:
-        with open(accounts_file, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(accounts, f, indent=4)
+        os.replace(tmp_path, accounts_file)
     except Exception as e:
         print(f"Error saving accounts: {e}")
 
+@functools.lru_cache(maxsize=256)
+def offline_uuid(name):
+    return str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, name))
+
 def add_account(acc_type, email_username, password_token=None):
     if not email_username: return
-    offline_uuid = str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, email_username))
     acc = {
         "type": acc_type,
         "username": email_username,
-        "uuid": offline_uuid,
+        "uuid": offline_uuid(email_username),
         "token": password_token or "null" if acc_type in ["tlauncher", "microsoft"] else "0",
         "client": "lunar" if acc_type == "lunar" else None
     }
@@ -84,25 +104,58 @@ def add_account(acc_type, email_username, password_token=None):
     print(f"Account '{email_username}' ({acc_type}) added.")
 
 # --- Cosmetics Functions (Lunar + TLauncher) ---
+# Cosmetics are cached in one SQLite file: entries expire after a day and
+# the least recently used ones are evicted past COSMETICS_CACHE_MAX_ENTRIES
+COSMETICS_CACHE_PATH = os.path.join(LUNAR_CACHE_DIR, "cosmetics.sqlite3")
+COSMETICS_CACHE_TTL = 24 * 60 * 60
+COSMETICS_CACHE_MAX_ENTRIES = 1024
+_cosmetics_lock = threading.Lock()
+
+def _open_cosmetics_cache():
+    conn = sqlite3.connect(COSMETICS_CACHE_PATH, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS cosmetics (uuid TEXT PRIMARY KEY, data TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+    return conn
+
+def _cosmetics_cache_get(uuid):
+    now = time.time()
+    with _cosmetics_lock, contextlib.closing(_open_cosmetics_cache()) as conn, conn:
+        row = conn.execute("SELECT data, stored_at FROM cosmetics WHERE uuid = ?", (uuid,)).fetchone()
+        if row is None:
+            return None
+        if now - row[1] > COSMETICS_CACHE_TTL:
+            conn.execute("DELETE FROM cosmetics WHERE uuid = ?", (uuid,))
+            return None
+        conn.execute("UPDATE cosmetics SET accessed_at = ? WHERE uuid = ?", (now, uuid))
+        return json.loads(row[0])
+
+def _cosmetics_cache_set(uuid, data):
+    now = time.time()
+    with _cosmetics_lock, contextlib.closing(_open_cosmetics_cache()) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO cosmetics VALUES (?, ?, ?, ?)", (uuid, json.dumps(data), now, now))
+        conn.execute("DELETE FROM cosmetics WHERE uuid NOT IN (SELECT uuid FROM cosmetics ORDER BY accessed_at DESC LIMIT ?)", (COSMETICS_CACHE_MAX_ENTRIES,))
+
 def fetch_lunar_cosmetics(uuid, ssl_verify=False):
-    cache_file = os.path.join(LUNAR_CACHE_DIR, f"{uuid}_cosmetics.json")
-    if os.path.isfile(cache_file):
-        with open(cache_file, 'r') as f:
-            return json.load(f)
-    
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+    try:
+        cached = _cosmetics_cache_get(uuid)
+    except sqlite3.Error as e:
+        print(f"Warning: Lunar cosmetics cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    headers = {"Accept": "application/json"}
     params = {"uuids": uuid}
     url = f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}"
     try:
-        context = get_ssl_context(ssl_verify)
-        req = urllib.request.Request(url, headers=headers)
         print(f"Fetching Lunar cosmetics from: {url}")
-        with urllib.request.urlopen(req, context=context) as response:
+        with open_url(url, ssl_verify, headers) as response:
             print(f"Response headers: {response.getheaders()}")
-            data = json.loads(response.read().decode())
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=4)
-            return data
+            data = _json_loads(response.read())
+        try:
+            _cosmetics_cache_set(uuid, data)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not cache Lunar cosmetics: {e}")
+        return data
     except urllib.error.HTTPError as e:
         print(f"HTTP Error {e.code} fetching Lunar cosmetics from {url}: {e.reason}")
         print(f"Response headers: {e.headers}")
@@ -119,26 +172,131 @@ def fetch_tlauncher_skin(username, ssl_verify=False):
     
     skin_url = f"{TLAUNCHER_SKIN_API}{username}.png"
     cape_url = f"{TLAUNCHER_SKIN_API}cape/{username}.png"
+    # Skin and cape come from the same host, so fetch both at once
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        skin_future = ex.submit(download_file, skin_url, skin_file, "TLauncher skin", ssl_verify)
+        cape_future = ex.submit(download_file, cape_url, cape_file, "TLauncher cape", ssl_verify)
+        try:
+            skin_future.result()
+        except Exception as e:
+            print(f"Failed to fetch TLauncher skin for {username}: {e}")
+            return None, None
+        try:
+            cape_future.result()
+        except Exception as e:
+            # Many players have no cape; the skin is still usable
+            print(f"No TLauncher cape for {username}: {e}")
+            cape_file = None
+    return skin_file, cape_file
+
+# --- DNS Pre-Resolution ---
+DOWNLOAD_HOSTS = ("launchermeta.mojang.com", "piston-meta.mojang.com", "libraries.minecraft.net",
+                  "resources.download.minecraft.net", "api.lunarclientprod.com")
+
+def prewarm_dns():
+    # Resolve the fixed download hosts ahead of time so the OS resolver cache
+    # is warm before the download workers open their first connections
+    for host in DOWNLOAD_HOSTS:
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+# --- Keep-Alive Connection Pool ---
+# One persistent connection per (scheme, host, verify) per thread, so repeat
+# requests to the same host skip the TCP + TLS handshake.
+MAX_REDIRECTS = 5
+_http_local = threading.local()
+
+def _get_connection(scheme, host, ssl_verify):
+    if not hasattr(_http_local, "pool"):
+        _http_local.pool = {}
+    key = (scheme, host, ssl_verify)
+    conn = _http_local.pool.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+        else:
+            conn = http.client.HTTPConnection(host, timeout=30)
+        _http_local.pool[key] = conn
+    return conn
+
+def _drop_connection(conn):
+    pool = getattr(_http_local, "pool", {})
+    for key in [k for k, c in pool.items() if c is conn]:
+        del pool[key]
+    conn.close()
+
+def _request(url, ssl_verify, headers):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conn = _get_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
     try:
-        download_file(skin_url, skin_file, "TLauncher skin", ssl_verify)
-        download_file(cape_url, cape_file, "TLauncher cape", ssl_verify)
-        return skin_file, cape_file
-    except urllib.error.HTTPError as e:
-        print(f"HTTP Error {e.code} fetching TLauncher skin/cape for {username}: {e.reason}")
-        return None, None
-    except Exception as e:
-        print(f"Failed to fetch TLauncher skin/cape for {username}: {e}")
-        return None, None
+        conn.request("GET", path, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        _drop_connection(conn)
+        if not reused:
+            raise
+        # The server closed an idle keep-alive socket; retry once on a fresh one
+        return _request(url, ssl_verify, headers)
+    except Exception:
+        _drop_connection(conn)
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None):
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        conn, response = _request(url, ssl_verify, headers)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            _drop_connection(conn)
+            raise
+        if not response.isclosed():
+            _drop_connection(conn)
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Directories already created this session; skips a mkdir syscall per file
+_known_dirs = set()
+
+def _ensure_dir(path):
+    if path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
 
 def download_file(url, dest_path, description="file", ssl_verify=False):
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
-    ssl_context = get_ssl_context(ssl_verify)
+    _ensure_dir(os.path.dirname(dest_path))
+    # Stream into a .part file and rename on success, so an interrupted
+    # download never leaves a truncated file under the final name
+    part_path = dest_path + ".part"
     try:
         print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
-        with urllib.request.urlopen(req, context=ssl_context) as response:
-            print(f"Response headers: {response.getheaders()}")
-            shutil.copyfileobj(response, open(dest_path, 'wb'))
+        try:
+            with open_url(url, ssl_verify) as response, open(part_path, 'wb') as out:
+                print(f"Response headers: {response.getheaders()}")
+                shutil.copyfileobj(response, out, length=COPY_BUFFER_SIZE)
+            os.replace(part_path, dest_path)
+        except BaseException:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            raise
         print(f"Finished downloading {os.path.basename(dest_path)}")
     except urllib.error.HTTPError as e:
         print(f"HTTP Error {e.code} downloading {description} from {url}: {e.reason}")
@@ -148,6 +306,62 @@ def download_file(url, dest_path, description="file", ssl_verify=False):
         print(f"Failed to download {description} from {url}: {e}")
         raise Exception(f"Failed to download {description} from {url}: {e}")
 
+# --- Parallel Downloads ---
+MAX_DOWNLOAD_WORKERS = 32
+
+def download_parallel(jobs, kind, status_callback=None, ssl_verify=False):
+    # jobs: list of (url, dest_path, description); raises on the first failure.
+    # Duplicate destinations (e.g. a library shared with the parent) are fetched once.
+    jobs = list({job[1]: job for job in jobs}.values())
+    if not jobs:
+        return
+    # Many assets share one of 256 prefix dirs; create each once up front
+    for d in {os.path.dirname(dest_path) for _, dest_path, _ in jobs}:
+        _ensure_dir(d)
+    total = len(jobs)
+    completed = 0
+    workers = min(MAX_DOWNLOAD_WORKERS, total)
+    pending = iter(jobs)
+
+    # Keep at most 2 * workers futures in flight; progress is reported here,
+    # in completion order, and the first failure stops further submissions
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        inflight = {}
+        for url, dest_path, description in itertools.islice(pending, workers * 2):
+            inflight[executor.submit(download_file, url, dest_path, description, ssl_verify)] = dest_path
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                dest_path = inflight.pop(future)
+                try:
+                    future.result()
+                except Exception:
+                    for other in inflight:
+                        other.cancel()
+                    raise
+                completed += 1
+                if status_callback: status_callback(f"Downloading {kind} {completed}/{total}: {os.path.basename(dest_path)}", "#00ccff")
+                for url, next_dest, description in itertools.islice(pending, 1):
+                    inflight[executor.submit(download_file, url, next_dest, description, ssl_verify)] = next_dest
+
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if orjson else json.dumps(obj, indent=4).encode()
+
+# --- Parsed JSON Cache ---
+# Version JSONs, asset indexes and the manifest are parsed once per process
+# and reused until the file's mtime or size changes on disk.
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def load_json_cached(path):
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
 # --- Version Manifest Loading ---
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
 all_versions = {}
@@ -157,8 +371,7 @@ def load_version_manifest(ssl_verify=False):
     try:
         if not os.path.isfile(version_manifest_path):
             download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify)
-        with open(version_manifest_path, 'r') as f:
-            version_manifest = json.load(f)
+        version_manifest = load_json_cached(version_manifest_path)
         all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
         return version_manifest
     except Exception as e:
@@ -176,79 +389,123 @@ def detect_rosetta():
     except:
         return False
 
+IS_OSX_ARM64 = is_arm64()
+
 def run_with_rosetta(cmd):
-    if is_arm64() and not detect_rosetta():
+    if IS_OSX_ARM64 and not detect_rosetta():
         return ['arch', '-x86_64'] + cmd
     return cmd
 
 # --- Minecraft Installation Logic ---
+def _existing_asset_hashes():
+    # One scandir per prefix dir instead of an isfile() stat per asset
+    objects_dir = os.path.join(ASSETS_DIR, "objects")
+    existing = set()
+    with os.scandir(objects_dir) as subdirs:
+        for sub in subdirs:
+            if sub.is_dir():
+                with os.scandir(sub.path) as entries:
+                    existing.update(e.name for e in entries if e.is_file())
+    return existing
+
+def _version_json_path(version_id):
+    return os.path.join(VERSIONS_DIR, version_id, f"{version_id}.json")
+
+def _load_vjson(version_id):
+    return load_json_cached(_version_json_path(version_id))
+
+def _resolve_version_chain(version_id, status_callback=None, ssl_verify=False):
+    # Walk inheritsFrom iteratively, downloading any missing JSON, and return
+    # [(id, data), ...] from the requested version up to its root parent
+    chain = []
+    seen = set()
+    current_id = version_id
+    while current_id and current_id not in seen:
+        seen.add(current_id)
+        json_path = _version_json_path(current_id)
+        if not os.path.isfile(json_path):
+            if current_id not in all_versions:
+                raise Exception(f"Version '{current_id}' not found in Mojang manifest.")
+            os.makedirs(os.path.dirname(json_path), exist_ok=True)
+            if status_callback: status_callback(f"Downloading version JSON for {current_id}...", "#00ccff")
+            download_file(all_versions[current_id], json_path, f"version JSON ({current_id})", ssl_verify)
+        data = _load_vjson(current_id)
+        chain.append((current_id, data))
+        current_id = data.get("inheritsFrom")
+    return chain
+
+def _rules_allow(rules):
+    return not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
+
+@functools.lru_cache(maxsize=32)
+def resolve_libs(version_id):
+    # Library list for the whole inheritsFrom chain with rules already applied,
+    # as (path, artifact, native_key) where native_key is None for classpath jars.
+    # The chain's JSONs must already be on disk (see _resolve_version_chain).
+    libs = []
+    current_id = version_id
+    seen = set()
+    while current_id and current_id not in seen:
+        seen.add(current_id)
+        data = _load_vjson(current_id)
+        for lib in data.get("libraries", []):
+            if not _rules_allow(lib.get("rules")):
+                continue
+            downloads = lib.get("downloads", {})
+            artifact = downloads.get("artifact")
+            if artifact and artifact.get("path"):
+                libs.append((os.path.join(LIBRARIES_DIR, artifact["path"]), artifact, None))
+            natives_info = lib.get("natives")
+            classifiers = downloads.get("classifiers", {})
+            if natives_info and classifiers:
+                native_key = 'natives-osx-arm64' if IS_OSX_ARM64 and 'natives-osx-arm64' in classifiers else natives_info.get('osx', '').replace("${arch}", "64")
+                if native_key in classifiers:
+                    native_artifact = classifiers[native_key]
+                    libs.append((os.path.join(LIBRARIES_DIR, native_artifact["path"]), native_artifact, native_key))
+        current_id = data.get("inheritsFrom")
+    return libs
+
 def install_version(version_id, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"Checking version: {version_id}...", "#00ccff")
     version_folder = os.path.join(VERSIONS_DIR, version_id)
-    version_json_path = os.path.join(version_folder, f"{version_id}.json")
-    version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
-
-    if not os.path.isfile(version_json_path):
-        if version_id not in all_versions:
-            raise Exception(f"Version '{version_id}' not found in Mojang manifest.")
-        version_url = all_versions[version_id]
-        os.makedirs(version_folder, exist_ok=True)
-        if status_callback: status_callback(f"Downloading version JSON for {version_id}...", "#00ccff")
-        download_file(version_url, version_json_path, f"version JSON ({version_id})", ssl_verify)
-
-    with open(version_json_path, 'r') as f:
-        version_data = json.load(f)
-
-    parent_id = version_data.get("inheritsFrom")
-    parent_data = {}
-    if parent_id:
-        if status_callback: status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...", "#00ccff")
-        install_version(parent_id, status_callback, ssl_verify)
-        parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
-
-    client_info = version_data.get("downloads", {}).get("client")
-    if client_info and not os.path.isfile(version_jar_path):
-        client_url = client_info.get("url")
-        if client_url:
-            if status_callback: status_callback(f"Downloading client JAR for {version_id}...", "#00ccff")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
-
-    libraries = version_data.get("libraries", []) + parent_data.get("libraries", [])
-    total_libs = len(libraries)
-    for i, lib in enumerate(libraries):
-        rules = lib.get("rules", [])
-        allowed = not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
-        if not allowed: continue
-
-        artifact = lib.get("downloads", {}).get("artifact")
-        if artifact and artifact.get("path"):
-            lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
-            if not os.path.isfile(lib_path):
-                lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
-                if status_callback: status_callback(f"Downloading library {i+1}/{total_libs}: {os.path.basename(lib_path)}", "#00ccff")
-                download_file(lib_url, lib_path, f"library ({os.path.basename(lib_path)})", ssl_verify)
-
-        natives_info = lib.get("natives")
-        classifiers = lib.get("downloads", {}).get("classifiers", {})
-        if natives_info and classifiers:
-            native_key = 'natives-osx-arm64' if is_arm64() and 'natives-osx-arm64' in classifiers else natives_info.get('osx', '').replace("${arch}", "64")
-            if native_key in classifiers:
-                native_artifact = classifiers[native_key]
-                native_path = os.path.join(LIBRARIES_DIR, native_artifact["path"])
-                if not os.path.isfile(native_path):
-                    native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
-                    if status_callback: status_callback(f"Downloading native library {i+1}/{total_libs}: {os.path.basename(native_path)}", "#00ccff")
-                    download_file(native_url, native_path, f"native library ({os.path.basename(native_path)})", ssl_verify)
-                natives_dir = os.path.join(version_folder, "natives")
-                os.makedirs(natives_dir, exist_ok=True)
-                with zipfile.ZipFile(native_path, 'r') as zf:
-                    for member in zf.namelist():
-                        if not member.startswith("META-INF/") and not member.endswith('/'):
-                            zf.extract(member, natives_dir)
-
-    asset_index_info = version_data.get("assetIndex") or parent_data.get("assetIndex")
+    chain = _resolve_version_chain(version_id, status_callback, ssl_verify)
+
+    for chain_id, chain_data in chain:
+        chain_jar_path = os.path.join(VERSIONS_DIR, chain_id, f"{chain_id}.jar")
+        client_info = chain_data.get("downloads", {}).get("client")
+        if client_info and not os.path.isfile(chain_jar_path):
+            client_url = client_info.get("url")
+            if client_url:
+                if status_callback: status_callback(f"Downloading client JAR for {chain_id}...", "#00ccff")
+                download_file(client_url, chain_jar_path, f"client JAR ({chain_id})", ssl_verify)
+
+    lib_jobs = []
+    native_paths = []
+    for lib_path, artifact, native_key in resolve_libs(version_id):
+        if not os.path.isfile(lib_path):
+            lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
+            kind = "native library" if native_key else "library"
+            lib_jobs.append((lib_url, lib_path, f"{kind} ({os.path.basename(lib_path)})"))
+        if native_key:
+            native_paths.append(lib_path)
+
+    download_parallel(lib_jobs, "library", status_callback, ssl_verify)
+
+    # Natives are extracted on this thread once all downloads have finished
+    natives_dir = os.path.join(version_folder, "natives")
+    for native_path in dict.fromkeys(native_paths):
+        os.makedirs(natives_dir, exist_ok=True)
+        # A stamp newer than the jar means this jar was already extracted
+        stamp_path = os.path.join(natives_dir, f".{os.path.basename(native_path)}.extracted")
+        if os.path.isfile(stamp_path) and os.path.getmtime(stamp_path) >= os.path.getmtime(native_path):
+            continue
+        with zipfile.ZipFile(native_path, 'r') as zf:
+            members = [m for m in zf.namelist() if not m.startswith("META-INF/") and not m.endswith('/')]
+            zf.extractall(natives_dir, members=members)
+        with open(stamp_path, 'w'):
+            pass
+
+    asset_index_info = next((chain_data["assetIndex"] for _, chain_data in chain if chain_data.get("assetIndex")), None)
     if asset_index_info:
         idx_id = asset_index_info["id"]
         idx_url = asset_index_info["url"]
@@ -257,31 +514,32 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
             if status_callback: status_callback(f"Downloading asset index {idx_id}...", "#00ccff")
             download_file(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify)
 
-        with open(idx_dest, 'r') as f:
-            idx_data = json.load(f)
-        total_assets = len(idx_data["objects"])
-        assets_downloaded = 0
+        idx_data = load_json_cached(idx_dest)
+        existing = _existing_asset_hashes()
+        asset_jobs = []
         for asset_name, info in idx_data["objects"].items():
             hash_val = info.get("hash")
             if hash_val:
                 subdir = hash_val[:2]
                 asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
-                if not os.path.isfile(asset_path):
-                    assets_downloaded += 1
-                    if status_callback: status_callback(f"Downloading asset {assets_downloaded}/{total_assets}: {asset_name}", "#00ccff")
-                    download_file(ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", ssl_verify)
-
-    try:
-        with open(version_json_path, 'r+') as vf:
-            data = json.load(vf)
-            if not data.get("skinVersion", False):
+                # Downloads land atomically, so a file under its final name is complete
+                if hash_val not in existing:
+                    asset_jobs.append((ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})"))
+        download_parallel(asset_jobs, "asset", status_callback, ssl_verify)
+
+    for chain_id, chain_data in chain:
+        if chain_data.get("skinVersion", False):
+            continue
+        try:
+            with open(_version_json_path(chain_id), 'rb+') as vf:
+                data = _json_loads(vf.read())
                 data["skinVersion"] = True
                 vf.seek(0)
-                json.dump(data, vf, indent=4)
+                vf.write(_json_dumps(data))
                 vf.truncate()
-                print(f"Patched {version_id}.json with skinVersion=true")
-    except Exception as e:
-        print(f"Warning: Could not set skinVersion in {version_id}.json - {e}")
+                print(f"Patched {chain_id}.json with skinVersion=true")
+        except Exception as e:
+            print(f"Warning: Could not set skinVersion in {chain_id}.json - {e}")
 
     if status_callback: status_callback(f"Version {version_id} installation complete.", "#00ff00")
 
@@ -342,6 +600,12 @@ def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"TLauncher cosmetics setup complete for {account['username']}", "#00ff00")
 
 # --- Game Launch Logic ---
+_PLACEHOLDER_RE = re.compile(r"\$\{[^}]+\}")
+
+def _substitute_placeholders(arg, replacements):
+    # Version JSONs use ${name} placeholders; unknown ones are left untouched
+    return _PLACEHOLDER_RE.sub(lambda m: replacements.get(m.group(0), m.group(0)), arg)
+
 def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=None, server_ip=None, port=None, 
                status_callback=None, use_rosetta=False, lunar_client=False, ssl_verify=False):
     if status_callback: status_callback(f"Preparing to launch {version_id}...", "#00ccff")
@@ -355,38 +619,30 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
     install_version(version_id, status_callback, ssl_verify)
 
     version_folder = os.path.join(VERSIONS_DIR, version_id)
-    version_json_path = os.path.join(version_folder, f"{version_id}.json")
-    with open(version_json_path, 'r') as f:
-        vdata = json.load(f)
+    vdata = _load_vjson(version_id)
 
     main_class = vdata.get("mainClass")
-    classpath = set()
-    natives_dir_absolute = os.path.abspath(os.path.join(version_folder, "natives"))
+    classpath = []
+    natives_dir_absolute = os.path.join(version_folder, "natives")
     parent_data = {}
     if vdata.get("inheritsFrom"):
-        parent_json_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
+        parent_data = _load_vjson(vdata["inheritsFrom"])
         main_class = main_class or parent_data.get("mainClass")
 
-    for lib in vdata.get("libraries", []) + parent_data.get("libraries", []):
-        if any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in lib.get("rules", [])) or not lib.get("rules"):
-            artifact = lib.get("downloads", {}).get("artifact")
-            if artifact and artifact.get("path"):
-                lib_file = os.path.join(LIBRARIES_DIR, artifact["path"])
-                if os.path.isfile(lib_file):
-                    classpath.add(os.path.abspath(lib_file))
+    for lib_file, _, native_key in resolve_libs(version_id):
+        if native_key is None and os.path.isfile(lib_file):
+            classpath.append(lib_file)
 
     version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
     if os.path.isfile(version_jar_path):
-        classpath.add(os.path.abspath(version_jar_path))
+        classpath.append(version_jar_path)
     elif vdata.get("inheritsFrom"):
         parent_jar_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.jar")
         if os.path.isfile(parent_jar_path):
-            classpath.add(os.path.abspath(parent_jar_path))
+            classpath.append(parent_jar_path)
 
     jvm_args = [f"-Xmx{ram_mb}M", f"-Djava.library.path={natives_dir_absolute}"]
-    if is_arm64():
+    if IS_OSX_ARM64:
         jvm_args.extend(["-XX:+UseG1GC", "-XX:MaxGCPauseMillis=200", "-XX:ParallelGCThreads=4", "-Dapple.awt.application.name=Cat Client"])
     if lunar_client and account["type"] != "offline":
         jvm_args.extend(["-Dfml.ignoreInvalidMinecraftCertificates=true", "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=true"])
@@ -401,7 +657,7 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
         "${auth_player_name}": account["username"],
         "${version_name}": version_id,
         "${game_directory}": effective_game_dir,
-        "${assets_root}": os.path.abspath(ASSETS_DIR),
+        "${assets_root}": ASSETS_DIR,
         "${assets_index_name}": (vdata.get("assetIndex") or parent_data.get("assetIndex", {})).get("id", "legacy"),
         "${auth_uuid}": account["uuid"],
         "${auth_access_token}": account["token"] if account["type"] != "offline" else "0",
@@ -415,13 +671,14 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
 
     for arg in raw_jvm_args:
         if isinstance(arg, str):
-            jvm_args.append(arg.format(**replacements))
-        elif isinstance(arg, dict) and any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in arg["rules"]):
+            jvm_args.append(_substitute_placeholders(arg, replacements))
+        elif isinstance(arg, dict) and _rules_allow(arg.get("rules")):
             value = arg["value"]
-            jvm_args.extend([v.format(**replacements)] if isinstance(value, list) else [v.format(**replacements)])
+            jvm_args.extend(_substitute_placeholders(v, replacements) for v in (value if isinstance(value, list) else [value]))
 
-    jvm_args.extend(["-cp", os.pathsep.join(classpath)])
-    game_args = [arg.format(**replacements) if isinstance(arg, str) else arg["value"][0].format(**replacements) for arg in raw_game_args if isinstance(arg, str) or (isinstance(arg, dict) and "value" in arg)]
+    # dict.fromkeys drops duplicates but keeps order, which decides class loading precedence
+    jvm_args.extend(["-cp", os.pathsep.join(dict.fromkeys(classpath))])
+    game_args = [_substitute_placeholders(arg if isinstance(arg, str) else arg["value"][0], replacements) for arg in raw_game_args if isinstance(arg, str) or (isinstance(arg, dict) and "value" in arg)]
 
     command = [java_path] + jvm_args + [main_class] + game_args
     if use_rosetta:
@@ -479,9 +736,48 @@ class M1LauncherApp:
         style.configure("Lunar.TCombobox", fieldbackground="#2A3435", background="#2A3435", foreground="#FFFFFF", arrowcolor="#00CCFF", borderwidth=0)
         style.map("Lunar.TCombobox", fieldbackground=[("readonly", "#2A3435")], background=[("readonly", "#2A3435")])
 
+        # Background threads post (kind, payload) events here; the Tk thread drains them
+        self._events = queue.Queue()
+        self.root.after(50, self._drain_events)
+
+        # set_status only records the latest message; the pump paints it at ~30 Hz
+        self._status_lock = threading.Lock()
+        self._status_latest = None
+        self.root.after(33, self._pump_status)
+
+        threading.Thread(target=prewarm_dns, daemon=True).start()
         self.refresh_account_list()
         self.load_manifest()
 
+    def _drain_events(self):
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "manifest":
+                self.version_manifest = payload
+                self.populate_version_list()
+                self.set_status("Ready", "#00CCFF")
+            elif kind == "manifest_error":
+                messagebox.showerror("Error", f"Failed to load version manifest: {payload}")
+                self.set_status(f"Error: {payload}", "#FF0000")
+            elif kind == "launch_done":
+                self.is_launching = False
+                self.launch_btn.config(state="normal", text=">")
+                if payload is not None:
+                    messagebox.showerror("Launch Failed", f"Error: {payload}")
+        self.root.after(50, self._drain_events)
+
+    def _pump_status(self):
+        with self._status_lock:
+            latest, self._status_latest = self._status_latest, None
+        if latest:
+            message, color = latest
+            self.status_var.set(message)
+            self.status_label.config(fg=color)
+        self.root.after(33, self._pump_status)
+
     def show_account_window(self):
         account_window = tk.Toplevel(self.root)
         account_window.title("Add Account")
@@ -546,13 +842,13 @@ class M1LauncherApp:
 
     def load_manifest(self):
         self.set_status("Loading manifest...", "#00CCFF")
+        threading.Thread(target=self._bg_load_manifest, daemon=True).start()
+
+    def _bg_load_manifest(self):
         try:
-            self.version_manifest = load_version_manifest(ssl_verify=False)
-            self.populate_version_list()
-            self.set_status("Ready", "#00CCFF")
+            self._events.put(("manifest", load_version_manifest(ssl_verify=False)))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load version manifest: {e}")
-            self.set_status(f"Error: {e}", "#FF0000")
+            self._events.put(("manifest_error", e))
 
     def populate_version_list(self):
         try:
@@ -565,8 +861,9 @@ class M1LauncherApp:
             self.set_status(f"Error: {e}", "#FF0000")
 
     def set_status(self, message, color="#00CCFF"):
-        self.status_var.set(message)
-        self.status_label.config(fg=color)
+        # Safe from any thread; intermediate messages between two paints are dropped
+        with self._status_lock:
+            self._status_latest = (message, color)
 
     def refresh_account_list(self):
         self.account_combo['values'] = [f"{acc['username']}" for acc in accounts]
@@ -587,7 +884,7 @@ class M1LauncherApp:
         if account_index == -1 and not accounts:
             result = messagebox.askyesno("No Account", "Launch offline with 'Player'?")
             if result:
-                selected_account = {"type": "offline", "username": "Player", "uuid": str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, "Player")), "token": "0"}
+                selected_account = {"type": "offline", "username": "Player", "uuid": offline_uuid("Player"), "token": "0"}
             else:
                 return
         elif account_index == -1 and accounts:
@@ -620,13 +917,10 @@ class M1LauncherApp:
                 ssl_verify=ssl_verify
             )
             self.set_status(f"Launched {item_to_launch}!", "#00FF00")
+            self._events.put(("launch_done", None))
         except Exception as e:
             self.set_status(f"Error: {e}", "#FF0000")
-            messagebox.showerror("Launch Failed", f"Error: {e}")
-        finally:
-            self.is_launching = False
-            self.launch_btn.config(state="normal", text=">")
-            self.root.update_idletasks()
+            self._events.put(("launch_done", e))
 
 if __name__ == "__main__":
     try:
@@ -1,7 +1,13 @@
 import traceback
 import os, sys, json, shutil, zipfile, threading
-import urllib.request
+import functools
+import queue
+import atexit
+import hashlib
+import urllib.parse
 import urllib.error
+import http.client
+import contextlib
 import ssl
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -10,38 +16,52 @@ import subprocess
 import uuid as uuidlib
 import platform
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson  # Optional: much faster JSON parse/serialize
+except ImportError:
+    orjson = None
 
 # --- Constants ---
 USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/102.0.0.0 Safari/537.36"
 VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
 ASSET_BASE_URL = "https://resources.download.minecraft.net/"
+LIBRARIES_BASE_URL = "https://libraries.minecraft.net/"
 TLAUNCHER_SKIN_API = "https://auth.tlauncher.org/skin/"
 
 # --- SSL Context Setup ---
+# Contexts are built once and shared, so the CA bundle is loaded a single
+# time and TLS sessions can be resumed across connections.
+_SSL_CTX_VERIFY = ssl.create_default_context()
+_SSL_CTX_UNVERIFIED = ssl._create_unverified_context()
+
 def get_ssl_context(verify=False):
-    if verify:
-        ctx = ssl.create_default_context()
+    return _SSL_CTX_VERIFY if verify else _SSL_CTX_UNVERIFIED
+
+# --- JSON Helpers ---
+def load_json(path):
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read()) if orjson else json.load(f)
+
+def dump_json(obj, path):
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
     else:
-        ctx = ssl._create_unverified_context()
-    return ctx
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=4)
 
 # --- Directory Setup ---
 mc_dir = os.path.expanduser("~/Library/Application Support/minecraft")
 lunar_dir = os.path.expanduser("~/.lunarclient")
-for d in [mc_dir, lunar_dir]:
-    if not os.path.isdir(d):
-        try:
-            os.makedirs(d, exist_ok=True)
-        except PermissionError as e:
-            print(f"Permission denied creating {d}: {e}")
-            sys.exit(1)
-
 VERSIONS_DIR = os.path.join(mc_dir, "versions")
 ASSETS_DIR = os.path.join(mc_dir, "assets")
 LIBRARIES_DIR = os.path.join(mc_dir, "libraries")
 LUNAR_CACHE_DIR = os.path.join(mc_dir, "lunar_cache")
 
-for d in [VERSIONS_DIR, os.path.join(ASSETS_DIR, "indexes"), os.path.join(ASSETS_DIR, "objects"), LIBRARIES_DIR, LUNAR_CACHE_DIR]:
+# makedirs(exist_ok=True) already no-ops on existing dirs, so no isdir pre-check
+for d in (mc_dir, lunar_dir, VERSIONS_DIR, os.path.join(ASSETS_DIR, "indexes"), os.path.join(ASSETS_DIR, "objects"), LIBRARIES_DIR, LUNAR_CACHE_DIR):
     try:
         os.makedirs(d, exist_ok=True)
     except PermissionError as e:
@@ -53,20 +73,49 @@ accounts = []
 accounts_file = os.path.join(mc_dir, "launcher_accounts.json")
 if os.path.isfile(accounts_file):
     try:
-        with open(accounts_file, 'r') as f:
-            accounts = json.load(f)
+        accounts = load_json(accounts_file)
     except Exception as e:
         print(f"Warning: Error loading accounts: {e}")
         accounts = []
 
+# (type, username) -> position in accounts, for O(1) lookups in add_account
+_account_index = {}
+for i, acc in enumerate(accounts):
+    _account_index.setdefault((acc.get("type"), acc.get("username")), i)
+
+# Saves are coalesced: save_accounts marks the list dirty and a single
+# delayed flush writes it out, so a burst of edits costs one rewrite.
+ACCOUNTS_SAVE_DELAY = 0.5
+_accounts_dirty = False
+_accounts_save_timer = None
+_accounts_lock = threading.Lock()
+
+def flush_accounts():
+    global _accounts_dirty, _accounts_save_timer
+    with _accounts_lock:
+        _accounts_save_timer = None
+        if not _accounts_dirty:
+            return
+        _accounts_dirty = False
+        tmp_path = accounts_file + ".tmp"
+        try:
+            dump_json(accounts, tmp_path)
+            os.replace(tmp_path, accounts_file)
+        except PermissionError as e:
+            print(f"Permission denied saving accounts: {e}")
+        except Exception as e:
+            print(f"Error saving accounts: {e}")
+
 def save_accounts():
-    try:
-        with open(accounts_file, 'w') as f:
-            json.dump(accounts, f, indent=4)
-    except PermissionError as e:
-        print(f"Permission denied saving accounts: {e}")
-    except Exception as e:
-        print(f"Error saving accounts: {e}")
+    global _accounts_dirty, _accounts_save_timer
+    with _accounts_lock:
+        _accounts_dirty = True
+        if _accounts_save_timer is None:
+            _accounts_save_timer = threading.Timer(ACCOUNTS_SAVE_DELAY, flush_accounts)
+            _accounts_save_timer.daemon = True
+            _accounts_save_timer.start()
+
+atexit.register(flush_accounts)
 
 def add_account(acc_type, email_username, password_token=None):
     if not email_username: return
@@ -78,30 +127,133 @@ def add_account(acc_type, email_username, password_token=None):
         "token": password_token or "null" if acc_type in ["tlauncher", "microsoft"] else "0",
         "client": "lunar" if acc_type == "lunar" else None
     }
-    for i, existing_acc in enumerate(accounts):
-        if existing_acc.get("type") == acc_type and existing_acc.get("username") == email_username:
-            accounts[i] = acc
-            save_accounts()
-            print(f"Account '{email_username}' ({acc_type}) updated.")
-            return
+    i = _account_index.get((acc_type, email_username))
+    if i is not None:
+        accounts[i] = acc
+        save_accounts()
+        print(f"Account '{email_username}' ({acc_type}) updated.")
+        return
+    _account_index[(acc_type, email_username)] = len(accounts)
     accounts.append(acc)
     save_accounts()
     print(f"Account '{email_username}' ({acc_type}) added.")
 
 # --- Download Function with Retries ---
-def download_file(url, dest_path, description="file", ssl_verify=False, retries=3):
+COPY_BUFFER_SIZE = 1024 * 1024
+SMALL_FILE_THRESHOLD = 128 * 1024
+_copy_local = threading.local()
+
+def _copy_buffer():
+    # One reusable buffer per thread, since downloads run on worker threads
+    if not hasattr(_copy_local, "buf"):
+        _copy_local.buf = bytearray(COPY_BUFFER_SIZE)
+        _copy_local.view = memoryview(_copy_local.buf)
+    return _copy_local.buf, _copy_local.view
+
+# --- Keep-Alive Connection Pool ---
+# One persistent connection per (scheme, host, verify) per thread, so repeat
+# downloads from the same host skip the TCP + TLS handshake.
+MAX_REDIRECTS = 5
+DEFAULT_HEADERS = {'User-Agent': USER_AGENT}
+_http_local = threading.local()
+
+def _get_connection(scheme, host, ssl_verify):
+    if not hasattr(_http_local, "pool"):
+        _http_local.pool = {}
+    key = (scheme, host, ssl_verify)
+    conn = _http_local.pool.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+        else:
+            conn = http.client.HTTPConnection(host, timeout=30)
+        _http_local.pool[key] = conn
+    return conn
+
+def _drop_connection(conn):
+    pool = getattr(_http_local, "pool", {})
+    for key in [k for k, c in pool.items() if c is conn]:
+        del pool[key]
+    conn.close()
+
+def _request(url, ssl_verify, headers):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conn = _get_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        _drop_connection(conn)
+        if not reused:
+            raise
+        # The server closed an idle keep-alive socket; retry once on a fresh one
+        return _request(url, ssl_verify, headers)
+    except Exception:
+        _drop_connection(conn)
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None):
+    headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
+    for _ in range(MAX_REDIRECTS + 1):
+        conn, response = _request(url, ssl_verify, headers)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            _drop_connection(conn)
+            raise
+        if not response.isclosed():
+            _drop_connection(conn)
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+def download_file(url, dest_path, description="file", ssl_verify=False, retries=3, extra_headers=None, expected_sha1=None):
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
-    ssl_context = get_ssl_context(ssl_verify)
     attempt = 0
     while attempt < retries:
         try:
             print(f"Attempt {attempt + 1}/{retries} - Downloading {description}: {os.path.basename(dest_path)} from {url}")
-            with urllib.request.urlopen(req, context=ssl_context) as response:
-                shutil.copyfileobj(response, open(dest_path, 'wb'))
+            # Stream into a .part file and rename on success, so an aborted
+            # download never leaves a truncated file at dest_path
+            tmp_path = dest_path + ".part"
+            hasher = hashlib.sha1() if expected_sha1 else None
+            try:
+                with open_url(url, ssl_verify, extra_headers) as response, open(tmp_path, 'wb') as out:
+                    length = response.length
+                    if length is not None and length < SMALL_FILE_THRESHOLD:
+                        data = response.read()
+                        if hasher: hasher.update(data)
+                        out.write(data)
+                    else:
+                        buf, view = _copy_buffer()
+                        while True:
+                            n = response.readinto(buf)
+                            if not n:
+                                break
+                            if hasher: hasher.update(view[:n])
+                            out.write(view[:n])
+                if hasher and hasher.hexdigest() != expected_sha1.lower():
+                    raise Exception(f"SHA-1 mismatch (expected {expected_sha1}, got {hasher.hexdigest()})")
+                os.replace(tmp_path, dest_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
             print(f"Finished downloading {os.path.basename(dest_path)}")
-            return True
+            return response.headers
         except urllib.error.HTTPError as e:
+            if e.code == 304:
+                raise  # Not Modified: the caller's cached copy is current
             print(f"HTTP Error {e.code} downloading {description} from {url}: {e.reason}")
             attempt += 1
             time.sleep(2 ** attempt)
@@ -114,24 +266,80 @@ def download_file(url, dest_path, description="file", ssl_verify=False, retries=
             time.sleep(2 ** attempt)
     raise Exception(f"Failed to download {description} after {retries} attempts")
 
+# --- Concurrent Downloads ---
+MAX_CONCURRENT_DOWNLOADS = 16
+
+def download_many(jobs, ssl_verify=False, progress_callback=None):
+    # jobs: iterable of (url, dest_path, description, sha1); raises on the first failure.
+    # Many asset names share one hash, so a destination listed twice is fetched once
+    jobs = list({job[1]: job for job in jobs}.values())
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_DOWNLOADS, len(jobs))) as executor:
+        futures = [executor.submit(download_file, url, dest_path, description, ssl_verify, expected_sha1=sha1) for url, dest_path, description, sha1 in jobs]
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress_callback: progress_callback(done, len(jobs))
+        except BaseException:
+            # Drop the queued downloads so the failure surfaces without waiting for them
+            for future in futures:
+                future.cancel()
+            raise
+
 # --- Version Manifest Loading ---
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
 all_versions = {}
 
+@functools.cache
+def _parse_manifest(path, mtime):
+    # mtime is part of the cache key so a refreshed manifest is re-parsed.
+    # The id -> url map and the sorted release tuple are derived once here.
+    version_manifest = load_json(path)
+    id_to_url = {}
+    releases = []
+    for v in version_manifest['versions']:
+        id_to_url[v['id']] = v['url']
+        if v['type'] == 'release':
+            releases.append(v['id'])
+    return version_manifest, id_to_url, tuple(sorted(releases, reverse=True))
+
+def refresh_version_manifest(ssl_verify=False):
+    # Conditional GET: only re-download the manifest when its ETag changed
+    etag_path = version_manifest_path + ".etag"
+    headers = {}
+    if os.path.isfile(version_manifest_path) and os.path.isfile(etag_path):
+        with open(etag_path, 'r') as f:
+            headers['If-None-Match'] = f.read().strip()
+    try:
+        response_headers = download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify, retries=1, extra_headers=headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        print("Version manifest not modified, using cached copy.")
+        return
+    etag = response_headers.get('ETag')
+    if etag:
+        with open(etag_path, 'w') as f:
+            f.write(etag)
+
 def load_version_manifest(ssl_verify=False):
     global all_versions
     try:
-        if not os.path.isfile(version_manifest_path):
-            download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify)
-        with open(version_manifest_path, 'r') as f:
-            version_manifest = json.load(f)
-        all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
-        return version_manifest
+        try:
+            refresh_version_manifest(ssl_verify)
+        except Exception as e:
+            if not os.path.isfile(version_manifest_path):
+                raise
+            print(f"Warning: Could not refresh version manifest, using cached copy: {e}")
+        version_manifest, all_versions, releases = _parse_manifest(version_manifest_path, os.path.getmtime(version_manifest_path))
+        return version_manifest, releases
     except Exception as e:
         print(f"Error loading version manifest: {e}")
-        return {"versions": []}
+        return {"versions": []}, ()
 
 # --- M1 Mac Specific Functions ---
+@functools.cache
 def is_arm64():
     return platform.machine() == 'arm64'
 
@@ -141,6 +349,20 @@ def run_with_rosetta(cmd):
     return cmd
 
 # --- Install Version ---
+def file_sha1(path):
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha1").hexdigest()
+        digest = hashlib.sha1()
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def is_file_valid(path, expected_sha1=None):
+    if not os.path.isfile(path):
+        return False
+    return not expected_sha1 or file_sha1(path) == expected_sha1
+
 def install_version(version_id, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"Checking version: {version_id}...", "#00ccff")
     version_folder = os.path.join(VERSIONS_DIR, version_id)
@@ -155,21 +377,62 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
         if status_callback: status_callback(f"Downloading version JSON for {version_id}...", "#00ccff")
         download_file(version_url, version_json_path, f"version JSON ({version_id})", ssl_verify)
 
-    with open(version_json_path, 'r') as f:
-        version_data = json.load(f)
+    version_data = load_json(version_json_path)
 
+    jobs = []
     client_info = version_data.get("downloads", {}).get("client")
-    if client_info and not os.path.isfile(version_jar_path):
+    if client_info and not is_file_valid(version_jar_path, client_info.get("sha1")):
         client_url = client_info.get("url")
         if client_url:
-            if status_callback: status_callback(f"Downloading client JAR for {version_id}...", "#00ccff")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
+            jobs.append((client_url, version_jar_path, f"client JAR ({version_id})", None))
         else:
             raise Exception(f"No client URL found for {version_id}")
 
+    for lib in version_data.get("libraries", []):
+        rules = lib.get("rules", [])
+        allowed = not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
+        if not allowed: continue
+        artifact = lib.get("downloads", {}).get("artifact")
+        if artifact and artifact.get("path"):
+            lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
+            if not os.path.isfile(lib_path):
+                lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
+                jobs.append((lib_url, lib_path, f"library ({os.path.basename(lib_path)})", None))
+
+    asset_index_info = version_data.get("assetIndex")
+    if asset_index_info:
+        idx_id = asset_index_info["id"]
+        idx_dest = os.path.join(ASSETS_DIR, "indexes", f"{idx_id}.json")
+        if not os.path.isfile(idx_dest):
+            if status_callback: status_callback(f"Downloading asset index {idx_id}...", "#00ccff")
+            download_file(asset_index_info["url"], idx_dest, f"asset index ({idx_id})", ssl_verify)
+        idx_data = load_json(idx_dest)
+        for info in idx_data.get("objects", {}).values():
+            hash_val = info.get("hash")
+            if hash_val:
+                asset_path = os.path.join(ASSETS_DIR, "objects", hash_val[:2], hash_val)
+                if not os.path.isfile(asset_path):
+                    jobs.append((f"{ASSET_BASE_URL}{hash_val[:2]}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", hash_val))
+
+    if jobs:
+        if status_callback: status_callback(f"Downloading {len(jobs)} file(s) for {version_id}...", "#00ccff")
+        progress = (lambda done, total: status_callback(f"Downloading files for {version_id}: {done}/{total}", "#00ccff")) if status_callback else None
+        download_many(jobs, ssl_verify, progress)
+        if client_info and not is_file_valid(version_jar_path, client_info.get("sha1")):
+            raise Exception(f"Client JAR for {version_id} failed SHA-1 verification")
+
     if status_callback: status_callback(f"Version {version_id} ready.", "#00ff00")
 
 # --- Lunar Client Launch Logic ---
+LAUNCH_LOG_PATH = os.path.join(mc_dir, "launcher_log.txt")
+LAUNCH_CRASH_CHECK_SECONDS = 1.0
+
+def _watch_game_process(process, status_callback=None):
+    returncode = process.wait()
+    if returncode != 0:
+        print(f"Game exited with code {returncode}, see {LAUNCH_LOG_PATH}")
+        if status_callback: status_callback(f"Game exited with code {returncode}", "#ff0000")
+
 def launch_lunar_client(version_id, account, ram_mb=4096, java_path="java", status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"Preparing Lunar Client {version_id}...", "#00ccff")
 
@@ -188,12 +451,15 @@ def launch_lunar_client(version_id, account, ram_mb=4096, java_path="java", stat
         try:
             os.symlink(VERSIONS_DIR, lunar_versions_dir, target_is_directory=True)
         except OSError:
-            shutil.copytree(VERSIONS_DIR, lunar_versions_dir, dirs_exist_ok=True)
+            try:
+                # APFS clonefile: copy-on-write, so no JAR bytes are duplicated
+                subprocess.run(['cp', '-Rc', VERSIONS_DIR, lunar_versions_dir], check=True)
+            except (OSError, subprocess.CalledProcessError):
+                shutil.copytree(VERSIONS_DIR, lunar_versions_dir, dirs_exist_ok=True)
 
     settings_path = os.path.join(lunar_dir, "settings.json")
     if not os.path.exists(settings_path):
-        with open(settings_path, 'w') as f:
-            json.dump({"gameDir": mc_dir, "jreDir": os.path.join(lunar_dir, "jre"), "lastVersion": version_id, "offline": account["type"] == "offline"}, f, indent=4)
+        dump_json({"gameDir": mc_dir, "jreDir": os.path.join(lunar_dir, "jre"), "lastVersion": version_id, "offline": account["type"] == "offline"}, settings_path)
 
     # Install base version
     install_version(version_id, status_callback, ssl_verify)
@@ -240,13 +506,18 @@ def launch_lunar_client(version_id, account, ram_mb=4096, java_path="java", stat
     print(f"Launch command: {' '.join(command)}")
     if status_callback: status_callback(f"Launching Lunar Client {version_id}...", "#00ccff")
     try:
-        process = subprocess.Popen(command, cwd=mc_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate(timeout=10)
-        if process.returncode and process.returncode != 0:
-            error_msg = f"Launch failed: {stderr.decode() if stderr else 'Unknown error'}"
+        # Game output goes to a log file rather than pipes, so a chatty JVM can
+        # never fill a pipe buffer and block
+        with open(LAUNCH_LOG_PATH, 'wb') as log_file:
+            process = subprocess.Popen(command, cwd=mc_dir, stdout=log_file, stderr=subprocess.STDOUT, start_new_session=True)
+        time.sleep(LAUNCH_CRASH_CHECK_SECONDS)
+        if process.poll() is not None and process.returncode != 0:
+            error_msg = f"Launch failed with exit code {process.returncode}, see {LAUNCH_LOG_PATH}"
             print(error_msg)
             if status_callback: status_callback(error_msg, "#ff0000")
-            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+            raise subprocess.CalledProcessError(process.returncode, command)
+        if process.returncode is None:
+            threading.Thread(target=_watch_game_process, args=(process, status_callback), daemon=True).start()
     except Exception as e:
         print(f"Launch error: {e}")
         if status_callback: status_callback(f"Error: {e}", "#ff0000")
@@ -263,6 +534,12 @@ class LunarLauncherApp:
 
         self.version_manifest = {"versions": []}
         self.is_launching = False
+        # One daemon worker fed by a queue runs all background work (manifest load, launches);
+        # unlike executor threads it is not joined at exit, so closing mid-download never hangs
+        self._jobs = queue.Queue()
+        self._closed = False
+        threading.Thread(target=self._worker, daemon=True).start()
+        self.root.protocol("WM_DELETE_WINDOW", self._shutdown)
 
         main_frame = tk.Frame(root, bg="#1C2526")
         main_frame.pack(expand=True, fill="both")
@@ -300,17 +577,45 @@ class LunarLauncherApp:
         self.load_manifest()
 
     def load_manifest(self):
+        # The manifest refresh hits the network, so it runs off the Tk thread
         self.set_status("Loading versions...", "#00CCFF")
+        self._jobs.put(self._load_manifest_bg)
+
+    def _worker(self):
+        while True:
+            self._jobs.get()()
+
+    def _post(self, callback, *args):
+        # Hand a result to the Tk thread, unless the window is already gone
+        if self._closed:
+            return
         try:
-            self.version_manifest = load_version_manifest(ssl_verify=False)
-            releases = sorted([v['id'] for v in self.version_manifest['versions'] if v['type'] == 'release'], reverse=True)
-            self.version_combo['values'] = releases
-            if releases:
-                self.version_combo.set(releases[0])
-            self.set_status("Ready", "#00CCFF")
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _post_status(self, message, color="#00CCFF"):
+        # Status callback for worker threads, including the game watcher that may outlive the window
+        self._post(self.set_status, message, color)
+
+    def _load_manifest_bg(self):
+        try:
+            version_manifest, releases = load_version_manifest(ssl_verify=False)
         except Exception as e:
-            self.set_status(f"Error: {e}", "#FF0000")
-            messagebox.showerror("Error", f"Failed to load versions: {e}")
+            self._post(self._on_manifest_error, e)
+            return
+        self._post(self._apply_manifest, version_manifest, releases)
+
+    def _apply_manifest(self, version_manifest, releases):
+        self.version_manifest = version_manifest
+        self.version_combo['values'] = releases
+        if releases:
+            self.version_combo.set(releases[0])
+        self.set_status("Ready", "#00CCFF")
+
+    def _on_manifest_error(self, e):
+        self.set_status(f"Error: {e}", "#FF0000")
+        messagebox.showerror("Error", f"Failed to load versions: {e}")
 
     def refresh_account_list(self):
         self.account_combo['values'] = [f"{acc['username']}" for acc in accounts]
@@ -347,23 +652,31 @@ class LunarLauncherApp:
         self.is_launching = True
         self.launch_btn.config(state="disabled", text="LAUNCHING")
         self.root.update_idletasks()
-        threading.Thread(
-            target=self._launch_task,
-            args=(version, selected_account),
-            daemon=True
-        ).start()
+        self._jobs.put(functools.partial(self._launch_task, version, selected_account))
 
     def _launch_task(self, version_id, account):
         try:
-            launch_lunar_client(version_id, account, status_callback=self.set_status)
-            self.set_status(f"Launched {version_id}!", "#00FF00")
+            launch_lunar_client(version_id, account, status_callback=self._post_status)
         except Exception as e:
+            self._post(self._on_launch_done, e, version_id)
+        else:
+            self._post(self._on_launch_done, None, version_id)
+
+    def _on_launch_done(self, e, version_id):
+        # Runs on the Tk thread once the launch settles
+        if self._closed:
+            return
+        if e:
             self.set_status(f"Error: {e}", "#FF0000")
             messagebox.showerror("Launch Failed", f"Error: {e}")
-        finally:
-            self.is_launching = False
-            self.launch_btn.config(state="normal", text="LAUNCH")
-            self.root.update_idletasks()
+        else:
+            self.set_status(f"Launched {version_id}!", "#00FF00")
+        self.is_launching = False
+        self.launch_btn.config(state="normal", text="LAUNCH")
+
+    def _shutdown(self):
+        self._closed = True
+        self.root.destroy()
 
 if __name__ == "__main__":
     try:
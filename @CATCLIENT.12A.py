@@ -1,14 +1,23 @@
 import traceback
 import os, sys, json, shutil, zipfile, threading
-import urllib.request
+import urllib.parse
 import urllib.error
+import http.client
+import contextlib
+import time
 import ssl
+import functools
+import hashlib
+import atexit
+import asyncio
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
 import subprocess
 import uuid as uuidlib
 import platform
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Constants ---
 USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/102.0.0.0 Safari/537.36"
@@ -17,6 +26,8 @@ LUNAR_COSMETICS_ENDPOINT = f"{LUNAR_API_BASE}/launcher/cosmetics/users"
 TLAUNCHER_SKIN_API = "https://auth.tlauncher.org/skin/"
 
 # --- SSL Context Setup ---
+# Built once per verify mode; loading the CA store on every connection is wasted work
+@functools.lru_cache(maxsize=2)
 def get_ssl_context(verify=False):
     if verify:
         ctx = ssl.create_default_context()
@@ -92,14 +103,12 @@ def fetch_lunar_cosmetics(uuid, ssl_verify=False):
         with open(cache_file, 'r') as f:
             return json.load(f)
     
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+    headers = {"Accept": "application/json"}
     params = {"uuids": uuid}
     url = f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}"
     try:
-        context = get_ssl_context(ssl_verify)
-        req = urllib.request.Request(url, headers=headers)
         print(f"Fetching Lunar cosmetics from: {url}")
-        with urllib.request.urlopen(req, context=context) as response:
+        with open_url(url, ssl_verify, headers) as response:
             print(f"Response headers: {response.getheaders()}")
             data = json.loads(response.read().decode())
             with open(cache_file, 'w') as f:
@@ -131,21 +140,211 @@ def fetch_tlauncher_skin(username, ssl_verify=False):
         print(f"Failed to fetch TLauncher skin/cape for {username}: {e}")
         return None, None
 
-def download_file(url, dest_path, description="file", ssl_verify=False):
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
-    ssl_context = get_ssl_context(ssl_verify)
+# --- Keep-Alive Connection Pool ---
+# Idle persistent connections per (scheme, host, verify), shared by all download
+# threads, so repeat requests to the same host skip the TCP + TLS handshake.
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 32
+_pool_lock = threading.Lock()
+_idle_connections = {}
+
+def _checkout_connection(scheme, host, ssl_verify):
+    key = (scheme, host, ssl_verify)
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return key, idle.pop()
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+    else:
+        conn = http.client.HTTPConnection(host, timeout=30)
+    return key, conn
+
+def _checkin_connection(key, conn):
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+def _request(url, ssl_verify, headers, method="GET"):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    key, conn = _checkout_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
     try:
-        print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
-        with urllib.request.urlopen(req, context=ssl_context) as response:
-            shutil.copyfileobj(response, open(dest_path, 'wb'))
-        print(f"Finished downloading {os.path.basename(dest_path)}")
-    except urllib.error.HTTPError as e:
-        print(f"HTTP Error {e.code} downloading {description} from {url}: {e.reason}")
-        raise Exception(f"Failed to download {description}: HTTP Error {e.code} - {e.reason}")
+        conn.request(method, path, headers=headers)
+        return key, conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+        # The server closed an idle keep-alive socket; retry on another one
+        return _request(url, ssl_verify, headers, method)
+    except Exception:
+        conn.close()
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None, method="GET"):
+    # Follows redirects; non-2xx responses raise urllib.error.HTTPError like urlopen
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        key, conn, response = _request(url, ssl_verify, headers, method)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            _checkin_connection(key, conn)
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            _checkin_connection(key, conn)
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed():
+            _checkin_connection(key, conn)
+        else:
+            conn.close()
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+PREWARM_HOSTS = ("launchermeta.mojang.com", "piston-meta.mojang.com", "libraries.minecraft.net", "resources.download.minecraft.net")
+
+def prewarm_connections(ssl_verify=False):
+    # Connect to the download hosts while the launcher sits idle, so DNS, TCP and
+    # TLS are already done and pooled when the user presses play
+    for host in PREWARM_HOSTS:
+        try:
+            key, conn = _checkout_connection("https", host, ssl_verify)
+            conn.connect()
+            _checkin_connection(key, conn)
+        except Exception:
+            pass
+
+COPY_BUFFER_SIZE = 64 * 1024
+DOWNLOAD_RETRIES = 3
+
+# --- SHA-1 Verification Cache ---
+# path -> [size, mtime_ns, sha1] for files whose hash already matched, so a warm
+# launch only stats each jar instead of re-hashing it
+VERIFIED_CACHE_PATH = os.path.join(mc_dir, ".verified.json")
+_verified_lock = threading.Lock()
+_verified = {}
+if os.path.isfile(VERIFIED_CACHE_PATH):
+    try:
+        with open(VERIFIED_CACHE_PATH, 'r') as f:
+            _verified = json.load(f)
     except Exception as e:
-        print(f"Failed to download {description} from {url}: {e}")
-        raise Exception(f"Failed to download {description}: {e}")
+        print(f"Warning: Error loading verification cache: {e}")
+
+def save_verified_cache():
+    tmp_path = VERIFIED_CACHE_PATH + ".tmp"
+    try:
+        with _verified_lock:
+            with open(tmp_path, 'w') as f:
+                json.dump(_verified, f)
+        os.replace(tmp_path, VERIFIED_CACHE_PATH)
+    except Exception as e:
+        print(f"Error saving verification cache: {e}")
+
+atexit.register(save_verified_cache)
+
+HASH_BUFFER_SIZE = 1024 * 1024
+
+def _file_sha1(path):
+    with open(path, 'rb') as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha1").hexdigest()
+        digest = hashlib.sha1()
+        buf = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+        return digest.hexdigest()
+
+def _record_verified(path, sha1):
+    st = os.stat(path)
+    with _verified_lock:
+        _verified[path] = [st.st_size, st.st_mtime_ns, sha1]
+
+def is_file_valid(path, sha1=None):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if not sha1:
+        return True
+    with _verified_lock:
+        if _verified.get(path) == [st.st_size, st.st_mtime_ns, sha1]:
+            return True
+    if _file_sha1(path) != sha1:
+        with _verified_lock:
+            _verified.pop(path, None)
+        return False
+    _record_verified(path, sha1)
+    return True
+
+def download_file(url, dest_path, description="file", ssl_verify=False, sha1=None):
+    # With sha1 given, the body is hashed while it streams to disk and a mismatch is retried
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    for attempt in range(DOWNLOAD_RETRIES):
+        try:
+            print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
+            digest = hashlib.sha1() if sha1 else None
+            with open_url(url, ssl_verify) as response, open(dest_path, 'wb') as out:
+                while chunk := response.read(COPY_BUFFER_SIZE):
+                    out.write(chunk)
+                    if digest: digest.update(chunk)
+            if digest and digest.hexdigest() != sha1:
+                os.remove(dest_path)
+                raise Exception(f"SHA-1 mismatch (expected {sha1}, got {digest.hexdigest()})")
+            if digest: _record_verified(dest_path, sha1)
+            print(f"Finished downloading {os.path.basename(dest_path)}")
+            return
+        except urllib.error.HTTPError as e:
+            print(f"HTTP Error {e.code} downloading {description} from {url}: {e.reason}")
+            raise Exception(f"Failed to download {description}: HTTP Error {e.code} - {e.reason}")
+        except Exception as e:
+            if attempt + 1 < DOWNLOAD_RETRIES:
+                time.sleep(0.2 * 2 ** attempt)  # Transient network error; back off and retry
+                continue
+            print(f"Failed to download {description} from {url}: {e}")
+            raise Exception(f"Failed to download {description}: {e}")
+
+# --- Concurrent Downloads ---
+MAX_CONCURRENT_DOWNLOADS = 32
+
+async def _download_all_async(jobs, status_callback, ssl_verify):
+    # Each download runs in a worker thread; the semaphore bounds how many are in flight.
+    # asyncio.to_thread uses the default executor, which is capped at cpu_count + 4 workers,
+    # so install one sized to the semaphore (asyncio.run shuts it down on exit)
+    total = len(jobs)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_DOWNLOADS, total)))
+    sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    done = 0
+
+    async def fetch(url, dest_path, description, sha1):
+        nonlocal done
+        async with sem:
+            await asyncio.to_thread(download_file, url, dest_path, description, ssl_verify, sha1)
+        done += 1
+        if status_callback: status_callback(f"Downloading files {done}/{total}: {os.path.basename(dest_path)}", "#00ccff")
+
+    await asyncio.gather(*(fetch(*job) for job in jobs))
+
+def download_all(jobs, status_callback=None, ssl_verify=False):
+    # jobs: list of (url, dest_path, description, sha1 or None); raises on the first failure
+    if jobs:
+        asyncio.run(_download_all_async(jobs, status_callback, ssl_verify))
 
 # --- Version Manifest Loading ---
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
@@ -164,6 +363,43 @@ def load_version_manifest(ssl_verify=False):
         print(f"Error loading version manifest: {e}")
         return {"versions": []}
 
+# --- Install Cache ---
+# version_id -> manifest ETag at the time that version last installed cleanly.
+# While Mojang's manifest is unchanged, a launch can skip the install walk.
+install_cache_path = os.path.join(mc_dir, "install_cache.json")
+install_cache = {}
+if os.path.isfile(install_cache_path):
+    try:
+        with open(install_cache_path, 'r') as f:
+            install_cache = json.load(f)
+    except Exception as e:
+        print(f"Warning: Error loading install cache: {e}")
+
+def fetch_manifest_etag(ssl_verify=False):
+    try:
+        with open_url(VERSION_MANIFEST_URL, ssl_verify, method="HEAD") as response:
+            response.read()
+            return response.getheader("ETag")
+    except Exception as e:
+        print(f"Could not fetch manifest ETag: {e}")
+        return None
+
+def is_install_current(version_id, etag):
+    version_folder = os.path.join(VERSIONS_DIR, version_id)
+    return (etag is not None and install_cache.get(version_id) == etag
+            and os.path.isfile(os.path.join(version_folder, f"{version_id}.json"))
+            and os.path.isfile(os.path.join(version_folder, f"{version_id}.jar")))
+
+def mark_installed(version_id, etag):
+    install_cache[version_id] = etag
+    tmp_path = install_cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(install_cache, f, indent=4)
+        os.replace(tmp_path, install_cache_path)
+    except Exception as e:
+        print(f"Error saving install cache: {e}")
+
 # --- M1 Mac Specific Functions ---
 def is_arm64():
     return platform.machine() == 'arm64'
@@ -180,9 +416,61 @@ def run_with_rosetta(cmd):
         return ['arch', '-x86_64'] + cmd
     return cmd
 
+@functools.lru_cache(maxsize=4)
+def probe_java(java_path):
+    # Resolve and sanity-check the Java binary once per session; returns
+    # (absolute path, first line of `java -version`)
+    resolved = shutil.which(java_path)
+    if not resolved:
+        raise Exception(f"Java not found: {java_path}")
+    result = subprocess.run([resolved, "-version"], capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        raise Exception(f"Java at {resolved} failed to run: {result.stderr.strip()}")
+    output = (result.stderr or result.stdout).strip()
+    return resolved, output.splitlines()[0] if output else ""
+
 # --- Minecraft Installation Logic ---
-def install_version(version_id, status_callback=None, ssl_verify=False):
-    if status_callback: status_callback(f"Checking version: {version_id}...", "#00ccff")
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+def extract_natives(jar_path, natives_dir):
+    # Streams each entry through a bounded buffer and skips files already
+    # extracted with the same size, so warm launches do almost no writes
+    with zipfile.ZipFile(jar_path, 'r') as zf:
+        for info in zf.infolist():
+            if info.filename.startswith("META-INF/") or info.is_dir():
+                continue
+            dest = os.path.normpath(os.path.join(natives_dir, info.filename))
+            if not dest.startswith(os.path.normpath(natives_dir) + os.sep):
+                continue  # Refuse entries that would escape natives_dir
+            try:
+                if os.path.getsize(dest) == info.file_size:
+                    continue
+            except OSError:
+                pass
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            with zf.open(info) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=EXTRACT_BUFFER_SIZE)
+
+# Parsed install plans per version for this session. Building one parses the
+# version and asset index JSONs and applies the library rules; install_version
+# then only has to check the files on disk. Cleared when the manifest changes.
+_resolved_versions = {}
+_resolved_etag = None
+_resolve_lock = threading.Lock()
+
+def sync_resolved_versions(etag):
+    global _resolved_etag
+    with _resolve_lock:
+        if etag != _resolved_etag:
+            _resolved_versions.clear()
+            _resolved_etag = etag
+
+def _resolve_version(version_id, status_callback=None, ssl_verify=False):
+    with _resolve_lock:
+        plan = _resolved_versions.get(version_id)
+    if plan is not None:
+        return plan
+
     version_folder = os.path.join(VERSIONS_DIR, version_id)
     version_json_path = os.path.join(version_folder, f"{version_id}.json")
     version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
@@ -201,22 +489,21 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
     parent_id = version_data.get("inheritsFrom")
     parent_data = {}
     if parent_id:
-        if status_callback: status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...", "#00ccff")
-        install_version(parent_id, status_callback, ssl_verify)
+        _resolve_version(parent_id, status_callback, ssl_verify)
         parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
         with open(parent_json_path, 'r') as pf:
             parent_data = json.load(pf)
 
+    # Jars are (url, path, description, sha1) checked by hash; assets are
+    # content-addressed and only checked for existence
+    jars = []
     client_info = version_data.get("downloads", {}).get("client")
-    if client_info and not os.path.isfile(version_jar_path):
-        client_url = client_info.get("url")
-        if client_url:
-            if status_callback: status_callback(f"Downloading client JAR for {version_id}...", "#00ccff")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
+    if client_info and client_info.get("url"):
+        jars.append((client_info["url"], version_jar_path, f"client JAR ({version_id})", client_info.get("sha1")))
 
     libraries = version_data.get("libraries", []) + parent_data.get("libraries", [])
-    total_libs = len(libraries)
-    for i, lib in enumerate(libraries):
+    native_paths = []
+    for lib in libraries:
         rules = lib.get("rules", [])
         allowed = not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
         if not allowed: continue
@@ -224,10 +511,8 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
         artifact = lib.get("downloads", {}).get("artifact")
         if artifact and artifact.get("path"):
             lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
-            if not os.path.isfile(lib_path):
-                lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
-                if status_callback: status_callback(f"Downloading library {i+1}/{total_libs}: {os.path.basename(lib_path)}", "#00ccff")
-                download_file(lib_url, lib_path, f"library ({os.path.basename(lib_path)})", ssl_verify)
+            lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
+            jars.append((lib_url, lib_path, f"library ({os.path.basename(lib_path)})", artifact.get("sha1")))
 
         natives_info = lib.get("natives")
         classifiers = lib.get("downloads", {}).get("classifiers", {})
@@ -236,17 +521,11 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
             if native_key in classifiers:
                 native_artifact = classifiers[native_key]
                 native_path = os.path.join(LIBRARIES_DIR, native_artifact["path"])
-                if not os.path.isfile(native_path):
-                    native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
-                    if status_callback: status_callback(f"Downloading native library {i+1}/{total_libs}: {os.path.basename(native_path)}", "#00ccff")
-                    download_file(native_url, native_path, f"native library ({os.path.basename(native_path)})", ssl_verify)
-                natives_dir = os.path.join(version_folder, "natives")
-                os.makedirs(natives_dir, exist_ok=True)
-                with zipfile.ZipFile(native_path, 'r') as zf:
-                    for member in zf.namelist():
-                        if not member.startswith("META-INF/") and not member.endswith('/'):
-                            zf.extract(member, natives_dir)
+                native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
+                jars.append((native_url, native_path, f"native library ({os.path.basename(native_path)})", native_artifact.get("sha1")))
+                native_paths.append(native_path)
 
+    assets = []
     asset_index_info = version_data.get("assetIndex") or parent_data.get("assetIndex")
     if asset_index_info:
         idx_id = asset_index_info["id"]
@@ -258,32 +537,80 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
 
         with open(idx_dest, 'r') as f:
             idx_data = json.load(f)
-        total_assets = len(idx_data["objects"])
-        assets_downloaded = 0
         for asset_name, info in idx_data["objects"].items():
             hash_val = info.get("hash")
             if hash_val:
                 subdir = hash_val[:2]
                 asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
-                if not os.path.isfile(asset_path):
-                    assets_downloaded += 1
-                    if status_callback: status_callback(f"Downloading asset {assets_downloaded}/{total_assets}: {asset_name}", "#00ccff")
-                    download_file(ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", ssl_verify)
-
-    try:
-        with open(version_json_path, 'r+') as vf:
-            data = json.load(vf)
-            if not data.get("skinVersion", False):
-                data["skinVersion"] = True
-                vf.seek(0)
-                json.dump(data, vf, indent=4)
-                vf.truncate()
-                print(f"Patched {version_id}.json with skinVersion=true")
-    except Exception as e:
-        print(f"Warning: Could not set skinVersion in {version_id}.json - {e}")
+                assets.append((ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", hash_val))
+
+    plan = {
+        "version_id": version_id,
+        "version_folder": version_folder,
+        "version_json_path": version_json_path,
+        "parent_id": parent_id,
+        "jars": jars,
+        "native_paths": native_paths,
+        "assets": assets,
+        "needs_skin_patch": not version_data.get("skinVersion", False),
+    }
+    with _resolve_lock:
+        _resolved_versions[version_id] = plan
+    return plan
+
+def _materialize(plan, status_callback=None, ssl_verify=False):
+    version_id = plan["version_id"]
+    if plan["parent_id"]:
+        if status_callback: status_callback(f"Version {version_id} inherits from {plan['parent_id']}. Installing parent...", "#00ccff")
+        _materialize(_resolve_version(plan["parent_id"], status_callback, ssl_verify), status_callback, ssl_verify)
+
+    # Client JAR, libraries and assets are independent, so they all go into one
+    # concurrent batch keyed by destination (shared files are fetched once)
+    jobs = {}
+    for job in plan["jars"]:
+        if not is_file_valid(job[1], job[3]):
+            jobs[job[1]] = job
+    for job in plan["assets"]:
+        if not os.path.isfile(job[1]):
+            jobs[job[1]] = job
+    download_all(list(jobs.values()), status_callback, ssl_verify)
+
+    natives_dir = os.path.join(plan["version_folder"], "natives")
+    for native_path in plan["native_paths"]:
+        os.makedirs(natives_dir, exist_ok=True)
+        extract_natives(native_path, natives_dir)
+
+    if plan["needs_skin_patch"]:
+        try:
+            with open(plan["version_json_path"], 'r+') as vf:
+                data = json.load(vf)
+                if not data.get("skinVersion", False):
+                    data["skinVersion"] = True
+                    vf.seek(0)
+                    json.dump(data, vf, indent=4)
+                    vf.truncate()
+                    print(f"Patched {version_id}.json with skinVersion=true")
+            plan["needs_skin_patch"] = False
+        except Exception as e:
+            print(f"Warning: Could not set skinVersion in {version_id}.json - {e}")
 
     if status_callback: status_callback(f"Version {version_id} installation complete.", "#00ff00")
 
+def install_version(version_id, status_callback=None, ssl_verify=False):
+    if status_callback: status_callback(f"Checking version: {version_id}...", "#00ccff")
+    _materialize(_resolve_version(version_id, status_callback, ssl_verify), status_callback, ssl_verify)
+
+def copy_if_changed(src, dst):
+    # shutil.copyfile takes the OS fast path (fcopyfile on macOS, sendfile on
+    # Linux); skip it entirely when dst already matches src's size and is newer
+    try:
+        src_st, dst_st = os.stat(src), os.stat(dst)
+        if src_st.st_size == dst_st.st_size and dst_st.st_mtime >= src_st.st_mtime:
+            return
+    except OSError:
+        pass
+    shutil.copyfile(src, dst)
+
 # --- Lunar Client Setup ---
 def setup_lunar_client(version_id, account, status_callback=None, ssl_verify=False):
     if account["type"] == "offline":
@@ -318,7 +645,7 @@ def setup_lunar_client(version_id, account, status_callback=None, ssl_verify=Fal
             download_file(cape["textureUrl"], cape_path, "Lunar cape texture", ssl_verify)
             cape_asset_path = os.path.join(ASSETS_DIR, "objects", cape["hash"][:2], cape["hash"])
             os.makedirs(os.path.dirname(cape_asset_path), exist_ok=True)
-            shutil.copy(cape_path, cape_asset_path)
+            copy_if_changed(cape_path, cape_asset_path)
 
     if status_callback: status_callback(f"Lunar Client setup complete for {version_id}", "#00ff00")
 
@@ -333,16 +660,16 @@ def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
     if skin_path:
         skin_asset_path = os.path.join(ASSETS_DIR, "objects", "skin", f"{account['uuid']}.png")
         os.makedirs(os.path.dirname(skin_asset_path), exist_ok=True)
-        shutil.copy(skin_path, skin_asset_path)
+        copy_if_changed(skin_path, skin_asset_path)
     if cape_path:
         cape_asset_path = os.path.join(ASSETS_DIR, "objects", "cape", f"{account['uuid']}.png")
         os.makedirs(os.path.dirname(cape_asset_path), exist_ok=True)
-        shutil.copy(cape_path, cape_asset_path)
+        copy_if_changed(cape_path, cape_asset_path)
     if status_callback: status_callback(f"TLauncher cosmetics setup complete for {account['username']}", "#00ff00")
 
 # --- Game Launch Logic ---
 def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=None, server_ip=None, port=None, 
-               status_callback=None, use_rosetta=False, lunar_client=False, ssl_verify=False):
+               status_callback=None, use_rosetta=False, lunar_client=False, ssl_verify=False, install=True):
     if status_callback: status_callback(f"Preparing to launch {version_id}...", "#00ccff")
     effective_game_dir = game_dir or mc_dir
     
@@ -359,8 +686,9 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
         setup_lunar_client(version_id, account, status_callback, ssl_verify)
     if account["type"] == "tlauncher":
         setup_tlauncher_cosmetics(account, status_callback, ssl_verify)
-    
-    install_version(version_id, status_callback, ssl_verify)
+
+    if install:
+        install_version(version_id, status_callback, ssl_verify)
 
     version_folder = os.path.join(VERSIONS_DIR, version_id)
     version_json_path = os.path.join(version_folder, f"{version_id}.json")
@@ -438,7 +766,9 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
     print(f"Launch command: {' '.join(command)}")
     if status_callback: status_callback(f"Launching Minecraft {version_id}...", "#00ccff")
     try:
-        process = subprocess.Popen(command, cwd=effective_game_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Python opens fds non-inheritable (O_CLOEXEC), so on POSIX the pre-exec close sweep is redundant
+        process = subprocess.Popen(command, cwd=effective_game_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   close_fds=os.name != "posix")
         stdout, stderr = process.communicate(timeout=10)
         if process.returncode and process.returncode != 0:
             error_msg = f"Launch failed: {stderr.decode() if stderr else 'Unknown error'}"
@@ -493,9 +823,39 @@ class M1LauncherApp:
         style.configure("Lunar.TCombobox", fieldbackground="#2A3435", background="#2A3435", foreground="#FFFFFF", arrowcolor="#00CCFF", borderwidth=0)
         style.map("Lunar.TCombobox", fieldbackground=[("readonly", "#2A3435")], background=[("readonly", "#2A3435")])
 
+        # Worker threads post ("error", title, message) and ("done",) events; the
+        # Tk thread drains them. Status text is coalesced: only the latest is kept.
+        self._status_q = queue.Queue()
+        self._last_status = self._painted_status = None
+        self.root.after(50, self._drain_status)
+        self._pool = ThreadPoolExecutor(max_workers=1)
+
+        threading.Thread(target=prewarm_connections, daemon=True).start()
         self.refresh_account_list()
         self.load_manifest()
 
+    def _drain_status(self):
+        # Runs at 20 Hz, so a burst of per-file updates costs one repaint
+        latest = self._last_status
+        if latest is not self._painted_status:
+            self.set_status(*latest)
+            self._painted_status = latest
+        while True:
+            try:
+                kind, *args = self._status_q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "error":
+                messagebox.showerror(*args)
+            elif kind == "done":
+                self.is_launching = False
+                self.launch_btn.config(state="normal", text=">")
+        self.root.after(50, self._drain_status)
+
+    def _post_status(self, message, color="#00CCFF"):
+        # Thread-safe stand-in for set_status, used as the worker's status_callback
+        self._last_status = (message, color)
+
     def show_account_window(self):
         account_window = tk.Toplevel(self.root)
         account_window.title("Add Account")
@@ -586,7 +946,6 @@ class M1LauncherApp:
 
         self.is_launching = True
         self.launch_btn.config(state="disabled", text=">")
-        self.root.update_idletasks()
         threading.Thread(
             target=self._launch_task,
             args=(self.version_var.get(), False, selected_account, 4096, "java", None, None, False, self.lunar_client_var.get(), False),
@@ -595,26 +954,33 @@ class M1LauncherApp:
 
     def _launch_task(self, item_to_launch, is_modpack, account, ram, java, server, port, use_rosetta, lunar_client, ssl_verify):
         try:
-            self.set_status(f"Checking {item_to_launch}...", "#00CCFF")
-            install_version(item_to_launch, self.set_status, ssl_verify)
-            self.set_status(f"{item_to_launch} ready. Launching...", "#00CCFF")
+            self._post_status(f"Checking {item_to_launch}...", "#00CCFF")
+            # The `java -version` probe overlaps with the install checks and downloads
+            java_future = self._pool.submit(probe_java, java)
+            etag = fetch_manifest_etag(ssl_verify)
+            sync_resolved_versions(etag)
+            if not is_install_current(item_to_launch, etag):
+                install_version(item_to_launch, self._post_status, ssl_verify)
+                if etag: mark_installed(item_to_launch, etag)
+            java_path, java_version = java_future.result()
+            print(f"Using Java: {java_path} ({java_version})")
+            self._post_status(f"{item_to_launch} ready. Launching...", "#00CCFF")
             launch_game(
                 version_id=item_to_launch,
                 account=account,
                 ram_mb=ram,
-                java_path=java,
-                status_callback=self.set_status,
+                java_path=java_path,
+                status_callback=self._post_status,
                 lunar_client=lunar_client,
-                ssl_verify=ssl_verify
+                ssl_verify=ssl_verify,
+                install=False
             )
-            self.set_status(f"Launched {item_to_launch}!", "#00FF00")
+            self._post_status(f"Launched {item_to_launch}!", "#00FF00")
         except Exception as e:
-            self.set_status(f"Error: {e}", "#FF0000")
-            messagebox.showerror("Launch Failed", f"Error: {e}")
+            self._post_status(f"Error: {e}", "#FF0000")
+            self._status_q.put(("error", "Launch Failed", f"Error: {e}"))
         finally:
-            self.is_launching = False
-            self.launch_btn.config(state="normal", text=">")
-            self.root.update_idletasks()
+            self._status_q.put(("done",))
 
 if __name__ == "__main__":
     try:
@@ -622,7 +988,6 @@ if __name__ == "__main__":
         app = M1LauncherApp(root)
         root.mainloop()
     except Exception as e:
-        print(f"Fatal error: {e}")
-        traceback.print_exc()
+        sys.stderr.write(f"Fatal error: {e}\n{traceback.format_exc()}")
         if 'root' in locals() and root:
             messagebox.showerror("Fatal Error", f"A fatal error occurred: {e}")
\ No newline at end of file
@@ -3,17 +3,45 @@ import os
 import sys
 import json
 import shutil
+import hashlib
 import zipfile
+import io
 import threading
-import urllib.request
+import queue
+import time
+import itertools
+import functools
+import urllib.parse
 import urllib.error
+import http.client
+import contextlib
 import ssl
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
+import glob
 import subprocess
 import uuid as uuidlib
 import platform
+import ctypes
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import ijson  # Optional: streams asset indexes instead of loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: much faster parsing of the version manifest
+except ImportError:
+    orjson = None
+
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(obj):
+    """Serializes obj to bytes (orjson only supports 2-space indentation)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if orjson else json.dumps(obj, indent=4).encode()
 
 # ----------------------------------------------------------------------------------
 #                           CROSS-PLATFORM MINECRAFT DIR
@@ -47,8 +75,15 @@ ASSET_BASE_URL = "https://resources.download.minecraft.net/"
 LIBRARIES_BASE_URL = "https://libraries.minecraft.net/"
 FORGE_MAVEN_URL = "https://maven.minecraftforge.net/"
 
+# Set CAT4K_DEBUG=1 to print full tracebacks for launch errors
+DEBUG = bool(os.environ.get("CAT4K_DEBUG"))
+
 # Determine the OS once
-IS_MAC = (platform.system() == 'Darwin')
+_OS_NAME = platform.system()
+IS_MAC = (_OS_NAME == 'Darwin')
+IS_WIN = (_OS_NAME == 'Windows')
+# OS name as used by Mojang's library rules and natives maps
+_MC_OS_NAME = "osx" if IS_MAC else "windows" if IS_WIN else "linux"
 
 # ----------------------------------------------------------------------------------
 #                             SSL CONTEXT & RELATED
@@ -65,6 +100,8 @@ def is_arm64():
     """Detect if we're on an ARM64 architecture (e.g., Apple Silicon)."""
     return platform.machine().lower() in ('arm64', 'aarch64')
 
+IS_ARM64 = is_arm64()
+
 def detect_rosetta():
     """
     Returns True if we're on macOS Apple Silicon *and* running under Rosetta 2.
@@ -72,6 +109,16 @@ def detect_rosetta():
     """
     if not IS_MAC:
         return False
+    try:
+        # Ask the kernel directly instead of spawning the sysctl tool
+        libc = ctypes.CDLL("/usr/lib/libc.dylib")
+        value = ctypes.c_int(0)
+        size = ctypes.c_size_t(ctypes.sizeof(value))
+        if libc.sysctlbyname(b"sysctl.proc_translated", ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+            return False  # The key is missing on Intel Macs
+        return value.value == 1
+    except Exception:
+        pass
     try:
         result = subprocess.run(['sysctl', '-n', 'sysctl.proc_translated'],
                                 capture_output=True, text=True)
@@ -79,12 +126,14 @@ def detect_rosetta():
     except:
         return False
 
+IS_ROSETTA = detect_rosetta()
+
 def run_with_rosetta(cmd):
     """
     If on macOS ARM and not under Rosetta, prepend 'arch -x86_64' to the cmd.
     Otherwise, returns cmd unchanged.
     """
-    if IS_MAC and is_arm64() and not detect_rosetta():
+    if IS_MAC and IS_ARM64 and not IS_ROSETTA:
         return ['arch', '-x86_64'] + cmd
     return cmd
 
@@ -117,20 +166,56 @@ for d in [
 #                          ACCOUNTS & AUTH MANAGEMENT
 # ----------------------------------------------------------------------------------
 
-accounts = []
+def write_file_atomic(path, data):
+    """Writes bytes to path through a temp file and os.replace, so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+accounts = {}  # (type, username) -> account, in insertion order; saved as a list
 accounts_file = os.path.join(mc_dir, "launcher_accounts.json")
 if os.path.isfile(accounts_file):
     try:
-        with open(accounts_file, 'r') as f:
-            accounts = json.load(f)
+        with open(accounts_file, 'rb') as f:
+            accounts = {(acc.get("type"), acc.get("username")): acc for acc in _json_loads(f.read())}
     except Exception as e:
         print(f"Warning: Error loading accounts: {e}")
-        accounts = []
+        accounts = {}
+
+ACCT_TLAUNCHER, ACCT_OFFLINE, ACCT_LUNAR, ACCT_MICROSOFT = (
+    sys.intern(t) for t in ("tlauncher", "offline", "lunar", "microsoft")
+)
+
+# Combo box labels per account type, so refreshing the list does no string munging
+_ACCOUNT_DISPLAY_FMT = {
+    ACCT_TLAUNCHER: "TLauncher: {}",
+    ACCT_OFFLINE: "Offline: {}",
+    ACCT_LUNAR: "Lunar: {}",
+    ACCT_MICROSOFT: "Microsoft: {}",
+}
+
+def account_display_name(acc):
+    acc_type = acc.get('type', 'N/A')
+    fmt = _ACCOUNT_DISPLAY_FMT.get(acc_type) or f"{acc_type.capitalize()}: {{}}"
+    return fmt.format(acc.get('username', 'Unknown'))
 
 def save_accounts():
     try:
-        with open(accounts_file, 'w') as f:
-            json.dump(accounts, f, indent=4)
+        new = _json_dumps(list(accounts.values()))
+        try:
+            # Skip the write entirely when nothing changed
+            if os.path.getsize(accounts_file) == len(new):
+                with open(accounts_file, 'rb') as f:
+                    if f.read() == new:
+                        return
+        except OSError:
+            pass
+        write_file_atomic(accounts_file, new)
     except Exception as e:
         print(f"Error saving accounts: {e}")
 
@@ -142,42 +227,38 @@ def add_account(acc_type, email_username, password_token=None):
         "type": acc_type,
         "username": email_username,
         "uuid": offline_uuid,
-        "token": password_token or "null" if acc_type in ["tlauncher", "microsoft"] else "0",
-        "client": "lunar" if acc_type == "lunar" else None
+        "token": password_token or "null" if acc_type in (ACCT_TLAUNCHER, ACCT_MICROSOFT) else "0",
+        "client": "lunar" if acc_type == ACCT_LUNAR else None
     }
-    for i, existing_acc in enumerate(accounts):
-        if existing_acc.get("type") == acc_type and existing_acc.get("username") == email_username:
-            accounts[i] = acc
-            save_accounts()
-            print(f"Account '{email_username}' ({acc_type}) updated.")
-            return
-    accounts.append(acc)
+    key = (acc_type, email_username)
+    existed = key in accounts
+    accounts[key] = acc
     save_accounts()
-    print(f"Account '{email_username}' ({acc_type}) added.")
+    print(f"Account '{email_username}' ({acc_type}) {'updated' if existed else 'added'}.")
 
 # ----------------------------------------------------------------------------------
 #                                COSMETICS
 # ----------------------------------------------------------------------------------
 
-def fetch_lunar_cosmetics(uuid, ssl_verify=False):
+@functools.lru_cache(maxsize=256)
+def _load_or_fetch_cosmetics(uuid, ssl_verify):
+    # Failures raise and are therefore not memoized
     cache_file = os.path.join(LUNAR_CACHE_DIR, f"{uuid}_cosmetics.json")
     if os.path.isfile(cache_file):
         with open(cache_file, 'r') as f:
             return json.load(f)
 
-    headers = {"User-Agent": USER_AGENT}
     params = {"uuids": uuid}
+    url = f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}"
+    with open_url(url, ssl_verify) as response:
+        data = json.loads(response.read().decode())
+    with open(cache_file, 'w') as f:
+        json.dump(data, f, indent=4)
+    return data
+
+def fetch_lunar_cosmetics(uuid, ssl_verify=False):
     try:
-        context = get_ssl_context(ssl_verify)
-        req = urllib.request.Request(
-            f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}", 
-            headers=headers
-        )
-        with urllib.request.urlopen(req, context=context) as response:
-            data = json.loads(response.read().decode())
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=4)
-            return data
+        return _load_or_fetch_cosmetics(uuid, ssl_verify)
     except Exception as e:
         print(f"Failed to fetch Lunar cosmetics for UUID {uuid}: {e}")
         return {}
@@ -203,35 +284,287 @@ def fetch_tlauncher_skin(username, ssl_verify=False):
     cape_exists = cape_file if os.path.isfile(cape_file) else None
     return skin_exists, cape_exists
 
-def download_file(url, dest_path, description="file", ssl_verify=False):
+# ----------------------------------------------------------------------------------
+#                          KEEP-ALIVE CONNECTION POOL
+# ----------------------------------------------------------------------------------
+
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 32
+_pool_lock = threading.Lock()
+_idle_connections = {}  # (scheme, host, ssl_verify) -> [idle connections]
+
+def _checkout_connection(scheme, host, ssl_verify):
+    key = (scheme, host, ssl_verify)
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return key, idle.pop()
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+    else:
+        conn = http.client.HTTPConnection(host, timeout=30)
+    return key, conn
+
+def _checkin_connection(key, conn):
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+def _request(url, ssl_verify, headers):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    key, conn = _checkout_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        return key, conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+        # The server closed an idle keep-alive socket; retry on another one
+        return _request(url, ssl_verify, headers)
+    except Exception:
+        conn.close()
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None):
+    """
+    GET a URL over a pooled keep-alive connection and yield the response.
+    Follows redirects; non-2xx responses raise urllib.error.HTTPError like urlopen.
+    """
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        key, conn, response = _request(url, ssl_verify, headers)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            _checkin_connection(key, conn)
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            _checkin_connection(key, conn)
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed():
+            _checkin_connection(key, conn)
+        else:
+            conn.close()
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+COPY_BUFFER_SIZE = 1 << 20
+SMALL_FILE_SIZE = 256 << 10
+
+def download_file(url, dest_path, description="file", ssl_verify=False, etag_path=None, sha1=None):
+    """
+    Downloads url to dest_path. With etag_path, the request is conditional on the
+    ETag stored there and a 304 leaves the existing dest_path untouched.
+    With sha1, the body is hashed as it streams and a mismatch is an error.
+    """
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    # Write to a side file so an interrupted download never leaves a truncated dest_path
+    part_path = dest_path + ".part"
+    headers = {}
+    if etag_path and os.path.isfile(dest_path):
+        try:
+            with open(etag_path, 'r') as f:
+                headers["If-None-Match"] = f.read().strip()
+        except OSError:
+            pass
     try:
         print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
-        with urllib.request.urlopen(req, context=get_ssl_context(ssl_verify)) as response, \
-             open(dest_path, 'wb') as out_file:
-            shutil.copyfileobj(response, out_file)
+        with open_url(url, ssl_verify, headers) as response:
+            hasher = hashlib.sha1() if sha1 else None
+            if response.length is not None and response.length <= SMALL_FILE_SIZE:
+                # Most asset objects are tiny: one read and one write, no copy loop
+                body = response.read()
+                if hasher:
+                    hasher.update(body)
+                with open(part_path, 'wb') as out_file:
+                    out_file.write(body)
+            else:
+                with open(part_path, 'wb', buffering=COPY_BUFFER_SIZE) as out_file:
+                    while True:
+                        chunk = response.read(COPY_BUFFER_SIZE)
+                        if not chunk:
+                            break
+                        if hasher:
+                            hasher.update(chunk)
+                        out_file.write(chunk)
+            etag = response.getheader("ETag")
+        if hasher and hasher.hexdigest() != sha1.lower():
+            raise Exception(f"SHA-1 mismatch (expected {sha1}, got {hasher.hexdigest()})")
+        os.replace(part_path, dest_path)
+        if etag_path:
+            if etag:
+                with open(etag_path, 'w') as f:
+                    f.write(etag)
+            elif os.path.exists(etag_path):
+                os.remove(etag_path)
         print(f"Finished downloading {os.path.basename(dest_path)}")
     except urllib.error.HTTPError as e:
+        if e.code == 304 and "If-None-Match" in headers:
+            print(f"{os.path.basename(dest_path)} is up to date")
+            # Record when the cached copy was last confirmed fresh
+            os.utime(dest_path)
+            return
         raise Exception(f"HTTP Error {e.code}: {e.reason}")
     except Exception as e:
         raise Exception(f"Failed to download {description} from {url}: {e}")
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+def is_file_intact(path, size=None):
+    """A file is taken as installed when it exists at the expected size."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return size is None or st.st_size == size
+
+def _scan_dir(path):
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+def make_installed_check():
+    """
+    Returns a check(path, size=None) equivalent to is_file_intact that lists each
+    directory once with os.scandir, so missing files cost a dict lookup instead of
+    a failed stat(). Sizes come from the cached DirEntry (free on Windows).
+    """
+    listings = {}
+    def check(path, size=None):
+        parent, name = os.path.split(path)
+        entries = listings.get(parent)
+        if entries is None:
+            entries = listings[parent] = _scan_dir(parent)
+        entry = entries.get(name)
+        if entry is None:
+            return False
+        try:
+            return entry.is_file() and (size is None or entry.stat().st_size == size)
+        except OSError:
+            return False
+    return check
+
+DOWNLOAD_WORKERS = 16
+ASSET_DOWNLOAD_WORKERS = 64  # Asset objects are tiny, so fetching them is latency bound
+
+def _download_many(jobs, ssl_verify=False, workers=DOWNLOAD_WORKERS, status_callback=None):
+    """
+    Downloads (url, dest, desc, sha1) jobs concurrently and raises the first failure.
+    Jobs sharing a destination are fetched once. jobs may be a lazy iterable,
+    in which case downloads start while it is still being produced.
+    """
+    if isinstance(jobs, list):
+        jobs = list({job[1]: job for job in jobs}.values())
+        if not jobs:
+            return
+        total = len(jobs)
+        if status_callback:
+            status_callback(f"Downloading {total} files...")
+        pending = iter(jobs)
+    else:
+        total = None
+        seen = set()
+        pending = (job for job in jobs if not (job[1] in seen or seen.add(job[1])))
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window in flight instead of queueing thousands of futures up front
+        in_flight = {}
+        for url, dest, desc, sha1 in itertools.islice(pending, workers * 2):
+            in_flight[executor.submit(download_file, url, dest, desc, ssl_verify, sha1=sha1)] = desc
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                desc = in_flight.pop(future)
+                try:
+                    future.result()
+                except Exception:
+                    for f in in_flight:
+                        f.cancel()
+                    raise
+                done += 1
+                if status_callback:
+                    status_callback(f"Downloaded {done}/{total}: {desc}" if total else f"Downloaded {done}: {desc}")
+            for url, dest, desc, sha1 in itertools.islice(pending, len(finished)):
+                in_flight[executor.submit(download_file, url, dest, desc, ssl_verify, sha1=sha1)] = desc
+
+def extract_natives(jar_path, natives_dir):
+    """
+    Extracts a natives jar into natives_dir, skipping META-INF and any member
+    already present at the same size. The jar is read in one go rather than in small chunks.
+    """
+    root = os.path.realpath(natives_dir)
+    with open(jar_path, 'rb') as fh:
+        data = io.BytesIO(fh.read())
+    with zipfile.ZipFile(data) as zf:
+        for info in zf.infolist():
+            if info.filename.startswith("META-INF/") or info.is_dir():
+                continue
+            target = os.path.realpath(os.path.join(root, info.filename))
+            if not target.startswith(root + os.sep):
+                continue
+            if is_file_intact(target, info.file_size):
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zf.open(info) as src, open(target, 'wb', buffering=COPY_BUFFER_SIZE) as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
 
 # ----------------------------------------------------------------------------------
 #                            VERSION MANIFEST LOADING
 # ----------------------------------------------------------------------------------
 
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
+version_manifest_etag_path = version_manifest_path + ".etag"
+MANIFEST_MAX_AGE = 3600  # Seconds a downloaded manifest is trusted without revalidating
 all_versions = {}
+_manifest_cache = {}  # (mtime_ns, size) of the manifest file -> parsed manifest
 
-def load_version_manifest(ssl_verify=False):
+def load_version_manifest(ssl_verify=False, max_age=MANIFEST_MAX_AGE):
+    """
+    Returns the parsed version manifest. A copy validated within max_age seconds
+    is used as is; older copies are revalidated with a conditional GET.
+    """
     global all_versions
     try:
-        if not os.path.isfile(version_manifest_path):
-            download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify)
-        with open(version_manifest_path, 'r') as f:
-            version_manifest = json.load(f)
-        all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
+        try:
+            age = time.time() - os.path.getmtime(version_manifest_path)
+        except OSError:
+            age = None
+        if age is None or not 0 <= age < max_age:
+            try:
+                download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest",
+                              ssl_verify, etag_path=version_manifest_etag_path)
+            except Exception as e:
+                if age is None:
+                    raise
+                print(f"Using cached version manifest: {e}")
+        st = os.stat(version_manifest_path)
+        key = (st.st_mtime_ns, st.st_size)
+        version_manifest = _manifest_cache.get(key)
+        if version_manifest is None:
+            with open(version_manifest_path, 'rb') as f:
+                version_manifest = _json_loads(f.read())
+            _manifest_cache.clear()
+            _manifest_cache[key] = version_manifest
+            all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
         return version_manifest
     except Exception as e:
         print(f"Error loading version manifest: {e}")
@@ -241,6 +574,55 @@ def load_version_manifest(ssl_verify=False):
 #                           MINECRAFT INSTALLATION LOGIC
 # ----------------------------------------------------------------------------------
 
+def lib_rules_allow(lib):
+    """Only allow libs for the current OS or if no OS is specified in rules."""
+    rules = lib.get("rules")
+    if not rules:
+        return True
+    for rule in rules:
+        if rule["action"] == "allow":
+            os_rule = rule.get("os")
+            if not os_rule or os_rule.get("name") == _MC_OS_NAME:
+                return True
+    return False
+
+def _iter_asset_index(idx_path):
+    """Yields (asset_name, info) from an asset index, streaming it when ijson is available."""
+    if ijson is not None:
+        with open(idx_path, 'rb') as f:
+            yield from ijson.kvitems(f, 'objects')
+    else:
+        with open(idx_path, 'r') as f:
+            yield from json.load(f)["objects"].items()
+
+def _iter_asset_jobs(idx_path):
+    installed = make_installed_check()
+    for asset_name, info in _iter_asset_index(idx_path):
+        hash_val = info.get("hash")
+        if hash_val:
+            subdir = hash_val[:2]
+            asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
+            if not installed(asset_path, info.get("size")):
+                yield (f"{ASSET_BASE_URL}{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", hash_val)
+
+def _install_signature(version_id):
+    """
+    Hash of the version JSON and every JSON it inherits from, which pins the
+    libraries, natives and asset index the install needs. None if any is missing.
+    """
+    h = hashlib.sha256()
+    seen = set()
+    while version_id and version_id not in seen:
+        seen.add(version_id)
+        try:
+            with open(os.path.join(VERSIONS_DIR, version_id, f"{version_id}.json"), 'rb') as f:
+                data = f.read()
+            version_id = json.loads(data).get("inheritsFrom")
+        except (OSError, ValueError):
+            return None
+        h.update(data)
+    return h.hexdigest()
+
 def install_version(version_id, status_callback=None, ssl_verify=False):
     if status_callback:
         status_callback(f"Checking version: {version_id}...")
@@ -248,6 +630,17 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
     version_folder = os.path.join(VERSIONS_DIR, version_id)
     version_json_path = os.path.join(version_folder, f"{version_id}.json")
     version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
+    sentinel_path = os.path.join(version_folder, ".installed")
+
+    # Fast path: a completed install of exactly these JSONs needs no file checks
+    try:
+        with open(sentinel_path, 'r') as f:
+            if f.read().strip() == _install_signature(version_id):
+                if status_callback:
+                    status_callback(f"Version {version_id} is already installed.")
+                return
+    except OSError:
+        pass
 
     if not os.path.isfile(version_json_path):
         if version_id not in all_versions:
@@ -263,58 +656,55 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
 
     parent_id = version_data.get("inheritsFrom")
     parent_data = {}
-    if parent_id:
-        if status_callback:
-            status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...")
-        install_version(parent_id, status_callback, ssl_verify)
-        parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
-
-    client_info = version_data.get("downloads", {}).get("client")
-    if client_info and not os.path.isfile(version_jar_path):
-        client_url = client_info.get("url")
-        if client_url:
+    # The parent installs in the background while this version's client JAR downloads
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        parent_future = None
+        if parent_id:
             if status_callback:
-                status_callback(f"Downloading client JAR for {version_id}...")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
+                status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...")
+            parent_future = executor.submit(install_version, parent_id, status_callback, ssl_verify)
 
+        client_info = version_data.get("downloads", {}).get("client")
+        if client_info and not is_file_intact(version_jar_path, client_info.get("size")):
+            client_url = client_info.get("url")
+            if client_url:
+                if status_callback:
+                    status_callback(f"Downloading client JAR for {version_id}...")
+                download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify,
+                              sha1=client_info.get("sha1"))
+
+        if parent_future:
+            parent_future.result()
+            parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
+            with open(parent_json_path, 'r') as pf:
+                parent_data = json.load(pf)
+
+    # Missing libraries and assets are collected first, then fetched concurrently
+    installed = make_installed_check()
+    needed = []
+    asset_jobs = ()
+    native_paths = []
     libraries = version_data.get("libraries", []) + parent_data.get("libraries", [])
-    for i, lib in enumerate(libraries):
-        rules = lib.get("rules", [])
-        # Only allow libs for the current OS or if no OS is specified in rules
-        allowed = (
-            not rules
-            or any(
-                (rule["action"] == "allow")
-                and (
-                    not rule.get("os")
-                    or rule["os"].get("name") == ("osx" if IS_MAC else "windows" if platform.system() == "Windows" else "linux")
-                )
-                for rule in rules
-            )
-        )
-        if not allowed:
+    for lib in libraries:
+        if not lib_rules_allow(lib):
             continue
 
         artifact = lib.get("downloads", {}).get("artifact")
         if artifact and artifact.get("path"):
             lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
-            if not os.path.isfile(lib_path):
+            if not installed(lib_path, artifact.get("size")):
                 lib_url = artifact.get("url") or (LIBRARIES_BASE_URL + artifact["path"])
-                if status_callback:
-                    status_callback(f"Downloading library {i+1}/{len(libraries)}: {os.path.basename(lib_path)}")
-                download_file(lib_url, lib_path, f"library ({os.path.basename(lib_path)})", ssl_verify)
+                needed.append((lib_url, lib_path, f"library ({os.path.basename(lib_path)})", artifact.get("sha1")))
 
         natives_info = lib.get("natives")
         classifiers = lib.get("downloads", {}).get("classifiers", {})
         if natives_info and classifiers:
             # Choose a natives key based on OS/arch
-            if IS_MAC and is_arm64() and 'natives-osx-arm64' in classifiers:
+            if IS_MAC and IS_ARM64 and 'natives-osx-arm64' in classifiers:
                 native_key = 'natives-osx-arm64'
             else:
                 # e.g. might be "natives-windows", "natives-linux", "natives-osx"
-                native_key = natives_info.get('osx') if IS_MAC else natives_info.get('windows') if platform.system() == 'Windows' else natives_info.get('linux')
+                native_key = natives_info.get(_MC_OS_NAME)
                 # Some templates are like "natives-windows-%(arch)", so handle that:
                 if native_key and isinstance(native_key, str):
                     native_key = native_key.replace("${arch}", "64")
@@ -322,21 +712,11 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
             if native_key and native_key in classifiers:
                 native_artifact = classifiers[native_key]
                 native_path = os.path.join(LIBRARIES_DIR, native_artifact["path"])
-                if not os.path.isfile(native_path):
+                if not installed(native_path, native_artifact.get("size")):
                     native_url = native_artifact.get("url") or (LIBRARIES_BASE_URL + native_artifact["path"])
-                    if status_callback:
-                        status_callback(f"Downloading native library: {os.path.basename(native_path)}")
-                    download_file(native_url, native_path, f"native library ({os.path.basename(native_path)})", ssl_verify)
-
-                natives_dir = os.path.join(version_folder, "natives")
-                os.makedirs(natives_dir, exist_ok=True)
-                try:
-                    with zipfile.ZipFile(native_path, 'r') as zf:
-                        for member in zf.namelist():
-                            if not member.startswith("META-INF/") and not member.endswith('/'):
-                                zf.extract(member, natives_dir)
-                except Exception as e:
-                    print(f"Warning: Failed to extract native library {native_path}: {e}")
+                    needed.append((native_url, native_path, f"native library ({os.path.basename(native_path)})",
+                                   native_artifact.get("sha1")))
+                native_paths.append(native_path)
 
     asset_index_info = version_data.get("assetIndex") or parent_data.get("assetIndex")
     if asset_index_info:
@@ -348,31 +728,38 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
                 status_callback(f"Downloading asset index {idx_id}...")
             download_file(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify)
 
-        with open(idx_dest, 'r') as f:
-            idx_data = json.load(f)
-        for asset_name, info in idx_data["objects"].items():
-            hash_val = info.get("hash")
-            if hash_val:
-                subdir = hash_val[:2]
-                asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
-                if not os.path.isfile(asset_path):
-                    if status_callback:
-                        status_callback(f"Downloading asset: {asset_name}")
-                    download_file(f"{ASSET_BASE_URL}{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", ssl_verify)
+        # Assets are queued as the index is parsed rather than after it is fully loaded
+        asset_jobs = _iter_asset_jobs(idx_dest)
+
+    _download_many(needed, ssl_verify, status_callback=status_callback)
+    _download_many(asset_jobs, ssl_verify, ASSET_DOWNLOAD_WORKERS, status_callback)
+
+    # Natives are extracted once every jar is on disk
+    natives_dir = os.path.join(version_folder, "natives")
+    if native_paths:
+        os.makedirs(natives_dir, exist_ok=True)
+        # zlib releases the GIL while inflating, so jars extract in parallel
+        with ThreadPoolExecutor(max_workers=min(len(native_paths), os.cpu_count() or 1)) as executor:
+            futures = {executor.submit(extract_natives, p, natives_dir): p for p in native_paths}
+            for future, native_path in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to extract native library {native_path}: {e}")
 
     # Patch "skinVersion" in JSON if missing
     try:
-        with open(version_json_path, 'r+') as vf:
-            data = json.load(vf)
-            if not data.get("skinVersion", False):
-                data["skinVersion"] = True
-                vf.seek(0)
-                json.dump(data, vf, indent=4)
-                vf.truncate()
-                print(f"Patched {version_id}.json with skinVersion=true")
+        if not version_data.get("skinVersion", False):
+            version_data["skinVersion"] = True
+            write_file_atomic(version_json_path, json.dumps(version_data, indent=4).encode())
+            print(f"Patched {version_id}.json with skinVersion=true")
     except Exception as e:
         print(f"Warning: Could not set skinVersion in {version_id}.json - {e}")
 
+    signature = _install_signature(version_id)
+    if signature:
+        write_file_atomic(sentinel_path, signature.encode())
+
     if status_callback:
         status_callback(f"Version {version_id} installation complete.")
 
@@ -380,8 +767,24 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
 #                           LUNAR CLIENT & TLAUNCHER SETUP
 # ----------------------------------------------------------------------------------
 
+def link_or_copy(src, dst):
+    """
+    Places src at dst as a hardlink when both are on one filesystem, otherwise
+    copies the bytes only (copyfile, which uses sendfile where available).
+    """
+    try:
+        if os.path.samefile(src, dst):
+            return
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 def setup_lunar_client(version_id, account, status_callback=None, ssl_verify=False):
-    if account["type"] == "offline":
+    if account["type"] == ACCT_OFFLINE:
         if status_callback:
             status_callback("Skipping Lunar setup for offline mode.")
         return
@@ -430,13 +833,13 @@ def setup_lunar_client(version_id, account, status_callback=None, ssl_verify=Fal
             # Also store a copy in .minecraft/assets if wanted
             cape_asset_path = os.path.join(ASSETS_DIR, "objects", cape["hash"][:2], cape["hash"])
             os.makedirs(os.path.dirname(cape_asset_path), exist_ok=True)
-            shutil.copy(cape_path, cape_asset_path)
+            link_or_copy(cape_path, cape_asset_path)
 
     if status_callback:
         status_callback(f"Lunar Client setup complete for {version_id}")
 
 def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
-    if account["type"] == "offline":
+    if account["type"] == ACCT_OFFLINE:
         if status_callback:
             status_callback("Skipping TLauncher cosmetics for offline mode.")
         return
@@ -446,11 +849,11 @@ def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
     if skin_path:
         skin_asset_path = os.path.join(ASSETS_DIR, "objects", "skin", f"{account['uuid']}.png")
         os.makedirs(os.path.dirname(skin_asset_path), exist_ok=True)
-        shutil.copy(skin_path, skin_asset_path)
+        link_or_copy(skin_path, skin_asset_path)
     if cape_path:
         cape_asset_path = os.path.join(ASSETS_DIR, "objects", "cape", f"{account['uuid']}.png")
         os.makedirs(os.path.dirname(cape_asset_path), exist_ok=True)
-        shutil.copy(cape_path, cape_asset_path)
+        link_or_copy(cape_path, cape_asset_path)
     if status_callback:
         status_callback(f"TLauncher cosmetics setup complete for {account['username']}")
 
@@ -458,6 +861,9 @@ def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
 #                                GAME LAUNCH LOGIC
 # ----------------------------------------------------------------------------------
 
+# Matches ${name} placeholders in Mojang argument templates (bare {name} too)
+_PLACEHOLDER_RE = re.compile(r'\$?\{(\w+)\}')
+
 def launch_game(
     version_id,
     account,
@@ -478,7 +884,7 @@ def launch_game(
 
     if lunar_client:
         setup_lunar_client(version_id, account, status_callback, ssl_verify)
-    if account["type"] == "tlauncher":
+    if account["type"] == ACCT_TLAUNCHER:
         setup_tlauncher_cosmetics(account, status_callback, ssl_verify)
 
     # Ensure the version is installed
@@ -490,7 +896,7 @@ def launch_game(
         vdata = json.load(f)
 
     main_class = vdata.get("mainClass")
-    classpath = set()
+    classpath = {}  # dict used as an ordered set
     natives_dir_absolute = os.path.abspath(os.path.join(version_folder, "natives"))
     parent_data = {}
     if vdata.get("inheritsFrom"):
@@ -499,41 +905,28 @@ def launch_game(
             parent_data = json.load(pf)
         main_class = main_class or parent_data.get("mainClass")
 
-    def lib_rules_allow(lib):
-        rules = lib.get("rules", [])
-        return (
-            not rules
-            or any(
-                (rule["action"] == "allow")
-                and (
-                    not rule.get("os")
-                    or rule["os"].get("name") == ("osx" if IS_MAC else "windows" if platform.system() == "Windows" else "linux")
-                )
-                for rule in rules
-            )
-        )
-
+    installed = make_installed_check()
     for lib in vdata.get("libraries", []) + parent_data.get("libraries", []):
         if lib_rules_allow(lib):
             artifact = lib.get("downloads", {}).get("artifact")
             if artifact and artifact.get("path"):
                 lib_file = os.path.join(LIBRARIES_DIR, artifact["path"])
-                if os.path.isfile(lib_file):
-                    classpath.add(os.path.abspath(lib_file))
+                if installed(lib_file):
+                    classpath[os.path.abspath(lib_file)] = None
 
     version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
     if os.path.isfile(version_jar_path):
-        classpath.add(os.path.abspath(version_jar_path))
+        classpath[os.path.abspath(version_jar_path)] = None
     elif vdata.get("inheritsFrom"):
         parent_jar_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.jar")
         if os.path.isfile(parent_jar_path):
-            classpath.add(os.path.abspath(parent_jar_path))
+            classpath[os.path.abspath(parent_jar_path)] = None
 
     jvm_args = [
         f"-Xmx{ram_mb}M",
         f"-Djava.library.path={natives_dir_absolute}"
     ]
-    if is_arm64():
+    if IS_ARM64:
         jvm_args.extend([
             "-XX:+UseG1GC",
             "-XX:MaxGCPauseMillis=200",
@@ -565,7 +958,7 @@ def launch_game(
         "assets_index_name": (vdata.get("assetIndex") or parent_data.get("assetIndex", {})).get("id", "legacy"),
         "auth_uuid": account["uuid"],
         "auth_access_token": account["token"],
-        "user_type": "msa" if account["type"] == "microsoft" else "legacy",
+        "user_type": "msa" if account["type"] == ACCT_MICROSOFT else "legacy",
         "version_type": vdata.get("type", "release"),
         "natives_directory": natives_dir_absolute,
         "classpath_separator": os.pathsep,
@@ -573,12 +966,19 @@ def launch_game(
         "launcher_version": "0.1.0"
     }
 
+    values = {k: str(v) for k, v in replacements.items()}
+
+    def subst(arg):
+        if "{" not in arg:
+            return arg
+        # Unknown placeholders raise KeyError, which skips the argument as before
+        return _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], arg)
+
     # Process JVM args
     for arg in raw_jvm_args:
         if isinstance(arg, str):
             try:
-                # Only replace placeholders present in the string
-                jvm_args.append(arg.format(**{k: v for k, v in replacements.items() if k in arg}))
+                jvm_args.append(subst(arg))
             except KeyError as e:
                 print(f"Warning: Skipping JVM arg with unknown placeholder: {e}")
         elif isinstance(arg, dict) and any(r["action"] == "allow" for r in arg.get("rules", [])):
@@ -586,20 +986,20 @@ def launch_game(
             try:
                 if isinstance(value, list):
                     for v in value:
-                        jvm_args.append(v.format(**replacements))
+                        jvm_args.append(subst(v))
                 else:
-                    jvm_args.append(value.format(**replacements))
+                    jvm_args.append(subst(value))
             except KeyError as e:
                 print(f"Warning: Skipping JVM arg with unknown placeholder: {e}")
 
-    jvm_args.extend(["-cp", os.pathsep.join(classpath)])
+    jvm_args.extend(["-cp", os.pathsep.join(classpath.keys())])
 
     # Process game args
     game_args = []
     for arg in raw_game_args:
         if isinstance(arg, str):
             try:
-                game_args.append(arg.format(**{k: v for k, v in replacements.items() if k in arg}))
+                game_args.append(subst(arg))
             except KeyError as e:
                 print(f"Warning: Skipping game arg with unknown placeholder: {e}")
         elif isinstance(arg, dict) and "value" in arg:
@@ -607,9 +1007,9 @@ def launch_game(
                 value = arg["value"]
                 if isinstance(value, list):
                     for v in value:
-                        game_args.append(v.format(**replacements))
+                        game_args.append(subst(v))
                 else:
-                    game_args.append(value.format(**replacements))
+                    game_args.append(subst(value))
             except KeyError as e:
                 print(f"Warning: Skipping game arg with unknown placeholder: {e}")
 
@@ -634,6 +1034,25 @@ def launch_game(
     except Exception as e:
         raise Exception(f"Failed to launch game: {e}")
 
+def jdk_version(java_path):
+    # Sort key for a bundled JDK launcher: JAVA_VERSION from Contents/Home/release, else the
+    # numbers in the bundle name; "1.8.0" counts as 8 so it sorts below 17 and 21
+    home = os.path.dirname(os.path.dirname(java_path))
+    version = ""
+    try:
+        with open(os.path.join(home, "release"), 'r') as f:
+            match = re.search(r'^JAVA_VERSION="([^"]+)"', f.read(), re.M)
+        if match:
+            version = match.group(1)
+    except OSError:
+        pass
+    if not version:
+        version = os.path.basename(os.path.dirname(os.path.dirname(home)))
+    numbers = [int(n) for n in re.findall(r"\d+", version)]
+    if len(numbers) > 1 and numbers[0] == 1:
+        numbers = numbers[1:]
+    return tuple(numbers)
+
 # ----------------------------------------------------------------------------------
 #                                 TKINTER GUI
 # ----------------------------------------------------------------------------------
@@ -645,6 +1064,10 @@ class M1LauncherApp:
         self.root.geometry("650x680")
 
         self.version_manifest = {"versions": []}
+        self.popular_modpacks = {}
+        # One long-lived worker runs launches instead of a new thread per click
+        self._launch_q = queue.Queue()
+        threading.Thread(target=self._launch_worker, daemon=True).start()
         self.ssl_verify_var = tk.BooleanVar(value=False)
 
         # ========================= SSL FRAME =========================
@@ -660,7 +1083,8 @@ class M1LauncherApp:
         ttk.Button(
             ssl_frame,
             text="Load Version Manifest",
-            command=self.load_manifest
+            # An explicit reload always revalidates with the server
+            command=lambda: self.load_manifest(max_age=0)
         ).grid(row=0, column=1, padx=5, pady=2)
 
         ttk.Label(
@@ -693,9 +1117,9 @@ class M1LauncherApp:
         ).grid(row=1, column=0, sticky="w", padx=5, pady=2)
 
         arch_label = (
-            "Apple Silicon (ARM64)" if is_arm64() else
+            "Apple Silicon (ARM64)" if IS_ARM64 else
             "Intel/Rosetta (x86_64)" if IS_MAC else
-            f"{platform.system()} {platform.machine()}"
+            f"{_OS_NAME} {platform.machine()}"
         )
         ttk.Label(
             m1_frame,
@@ -705,8 +1129,8 @@ class M1LauncherApp:
         rosetta_label = "N/A (non-macOS)"  
         if IS_MAC:
             rosetta_label = (
-                "Yes (active)" if detect_rosetta() else
-                "Installed, not active" if is_arm64() else
+                "Yes (active)" if IS_ROSETTA else
+                "Installed, not active" if IS_ARM64 else
                 "N/A (Intel Mac)"
             )
         ttk.Label(
@@ -723,15 +1147,15 @@ class M1LauncherApp:
         acct_frame = ttk.LabelFrame(root, text="Accounts")
         acct_frame.pack(fill="x", padx=10, pady=5)
 
-        self.acct_type_var = tk.StringVar(value="tlauncher")
-        ttk.Radiobutton(acct_frame, text="TLauncher", variable=self.acct_type_var, value="tlauncher").grid(row=0, column=0, sticky="w", padx=5)
-        ttk.Radiobutton(acct_frame, text="Offline",   variable=self.acct_type_var, value="offline").grid(row=0, column=1, sticky="w", padx=5)
-        ttk.Radiobutton(acct_frame, text="Lunar",     variable=self.acct_type_var, value="lunar").grid(row=0, column=2, sticky="w", padx=5)
+        self.acct_type_var = tk.StringVar(value=ACCT_TLAUNCHER)
+        ttk.Radiobutton(acct_frame, text="TLauncher", variable=self.acct_type_var, value=ACCT_TLAUNCHER).grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Radiobutton(acct_frame, text="Offline",   variable=self.acct_type_var, value=ACCT_OFFLINE).grid(row=0, column=1, sticky="w", padx=5)
+        ttk.Radiobutton(acct_frame, text="Lunar",     variable=self.acct_type_var, value=ACCT_LUNAR).grid(row=0, column=2, sticky="w", padx=5)
         ttk.Radiobutton(
             acct_frame,
             text="Microsoft (Demo)",
             variable=self.acct_type_var,
-            value="microsoft",
+            value=ACCT_MICROSOFT,
             state="disabled"
         ).grid(row=0, column=3, sticky="w", padx=5)
 
@@ -772,13 +1196,19 @@ class M1LauncherApp:
         options_frame.pack(fill="x", padx=10, pady=5)
 
         ttk.Label(options_frame, text="Max RAM (MB):").grid(row=0, column=0, padx=5, pady=3, sticky="e")
-        self.ram_spin = ttk.Spinbox(options_frame, from_=512, to=32768, increment=512, width=10)
+        # Digits only, so RAM and port never need a parse error path
+        digits_only = (self.root.register(lambda text: text == "" or text.isdecimal()), "%P")
+        self.ram_spin = ttk.Spinbox(options_frame, from_=512, to=32768, increment=512, width=10,
+                                    validate="key", validatecommand=digits_only)
         self.ram_spin.set("4096")
         self.ram_spin.grid(row=0, column=1, pady=3, sticky="w")
 
         ttk.Label(options_frame, text="Java Path:").grid(row=1, column=0, padx=5, pady=3, sticky="e")
         self.java_entry = ttk.Entry(options_frame, width=40)
-        self.java_entry.insert(0, self.find_java())
+        self._java_path_cache = None
+        # Probing for Java stats PATH entries and JDK folders; keep it off the Tk thread
+        threading.Thread(target=self._find_java_worker, daemon=True).start()
+        self.java_entry.bind("<FocusOut>", self._forget_java_path)
         self.java_entry.grid(row=1, column=1, padx=5, pady=3, sticky="we")
         ttk.Button(options_frame, text="Browse...", command=self.browse_java).grid(row=1, column=2, padx=5)
 
@@ -787,7 +1217,7 @@ class M1LauncherApp:
         self.server_entry.grid(row=2, column=1, padx=5, pady=3, sticky="w")
 
         ttk.Label(options_frame, text="Port:").grid(row=2, column=2, padx=2, pady=3, sticky="e")
-        self.port_entry = ttk.Entry(options_frame, width=8)
+        self.port_entry = ttk.Entry(options_frame, width=8, validate="key", validatecommand=digits_only)
         self.port_entry.grid(row=2, column=3, padx=5, pady=3, sticky="w")
 
         options_frame.columnconfigure(1, weight=1)
@@ -796,7 +1226,12 @@ class M1LauncherApp:
         self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Frame(root, relief=tk.SUNKEN, padding="2 2 2 2")
         status_bar.pack(side=tk.BOTTOM, fill="x")
-        ttk.Label(status_bar, textvariable=self.status_var).pack(side=tk.LEFT)
+        self.status_label = ttk.Label(status_bar, textvariable=self.status_var)
+        self.status_label.pack(side=tk.LEFT)
+        # Worker threads overwrite this slot; the UI paints the newest message at most every 50 ms
+        self._status_lock = threading.Lock()
+        self._pending_status = None
+        self.root.after(50, self._drain_status)
 
         # ========================= LAUNCH BUTTON =========================
         launch_frame = ttk.Frame(root)
@@ -806,15 +1241,13 @@ class M1LauncherApp:
 
         # ========================= STYLING =========================
         style = ttk.Style()
-        # Attempt 'aqua' theme on macOS, otherwise fallback
-        try:
-            if IS_MAC:
+        # Attempt 'aqua' theme on macOS; other systems keep their default theme as is
+        if IS_MAC:
+            try:
                 style.theme_use('aqua')
-            else:
-                style.theme_use(style.theme_use())  # Keep the default on other systems
-        except tk.TclError:
-            # If 'aqua' not available, just continue with the system default
-            pass
+            except tk.TclError:
+                # If 'aqua' not available, just continue with the system default
+                pass
 
         style.configure("Accent.TButton", font=('Helvetica', 12, 'bold'))
 
@@ -824,34 +1257,63 @@ class M1LauncherApp:
 
     # --------------------------- LOADING & POPULATING VERSIONS ---------------------------
 
-    def load_manifest(self):
+    def load_manifest(self, max_age=MANIFEST_MAX_AGE):
         self.set_status("Loading version manifest...", "blue")
+        # No version can be picked until the list is back
+        self.version_combo.config(state="disabled")
+        threading.Thread(
+            target=self._load_manifest_worker,
+            args=(self.ssl_verify_var.get(), max_age),
+            daemon=True
+        ).start()
+
+    def _load_manifest_worker(self, ssl_verify, max_age):
         try:
-            self.version_manifest = load_version_manifest(self.ssl_verify_var.get())
-            self.populate_version_list()
-            self.set_status("Version manifest loaded successfully.", "green")
+            manifest = load_version_manifest(ssl_verify, max_age)
         except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"Failed to load version manifest: {e}\n\n"
-                "Try unchecking 'Verify SSL Certificates' if you suspect SSL issues."
-            )
-            self.set_status(f"Error loading manifest: {e}", "red")
+            self.root.after(0, self._manifest_failed, e)
+        else:
+            self.root.after(0, self._apply_manifest, manifest)
+
+    def _apply_manifest(self, manifest):
+        self.version_manifest = manifest
+        self.version_combo.config(state="readonly")
+        self.populate_version_list()
+        self.set_status("Version manifest loaded successfully.", "green")
+
+    def _manifest_failed(self, e):
+        self.version_combo.config(state="readonly")
+        messagebox.showerror(
+            "Error",
+            f"Failed to load version manifest: {e}\n\n"
+            "Try unchecking 'Verify SSL Certificates' if you suspect SSL issues."
+        )
+        self.set_status(f"Error loading manifest: {e}", "red")
+
+    def _compute_version_lists(self, manifest):
+        """Sorted (releases, snapshots) for a manifest, reused while the manifest object is unchanged."""
+        cached = getattr(self, "_version_lists", None)
+        if cached is not None and cached[0] is manifest:
+            return cached[1], cached[2]
+        release_versions = sorted(
+            [v['id'] for v in manifest['versions'] if v['type'] == 'release'],
+            reverse=True
+        )
+        snapshot_versions = sorted(
+            [v['id'] for v in manifest['versions'] if v['type'] == 'snapshot'],
+            reverse=True
+        )
+        self._version_lists = (manifest, release_versions, snapshot_versions)
+        return release_versions, snapshot_versions
 
     def populate_version_list(self):
         try:
-            release_versions = sorted(
-                [v['id'] for v in self.version_manifest['versions'] if v['type'] == 'release'],
-                reverse=True
-            )
-            snapshot_versions = sorted(
-                [v['id'] for v in self.version_manifest['versions'] if v['type'] == 'snapshot'],
-                reverse=True
-            )
-            custom_versions = [
-                item for item in os.listdir(VERSIONS_DIR)
-                if os.path.isdir(os.path.join(VERSIONS_DIR, item)) and item not in all_versions
-            ]
+            release_versions, snapshot_versions = self._compute_version_lists(self.version_manifest)
+            with os.scandir(VERSIONS_DIR) as it:
+                custom_versions = [
+                    entry.name for entry in it
+                    if entry.is_dir() and entry.name not in all_versions
+                ]
             self.popular_modpacks = {
                 "RLCraft (Modpack)": "rlcraft",
                 "All the Mods 9 (Modpack)": "all-the-mods-9-atm9",
@@ -862,11 +1324,15 @@ class M1LauncherApp:
             }
             modpack_names = sorted(self.popular_modpacks.keys())
             combined_list = (
-                modpack_names
-                + sorted(custom_versions, reverse=True)
-                + release_versions
-                + snapshot_versions
+                *modpack_names,
+                *sorted(custom_versions, reverse=True),
+                *release_versions,
+                *snapshot_versions,
             )
+            # An identical list (e.g. a reload that hit a 304) keeps the combo box and selection as is
+            if combined_list == getattr(self, "_version_values", None):
+                return
+            self._version_values = combined_list
             self.version_combo['values'] = combined_list
             if release_versions:
                 self.version_combo.set(release_versions[0])
@@ -879,6 +1345,19 @@ class M1LauncherApp:
     # --------------------------- JAVA DETECTION/BROWSING ---------------------------
 
     def find_java(self):
+        """
+        Return the detected Java path, probing only the first time.
+        The cached result is dropped when the user edits the Java field.
+        """
+        if self._java_path_cache is None:
+            self._java_path_cache = self._detect_java()
+        return self._java_path_cache
+
+    def _forget_java_path(self, event=None):
+        # The user edited the Java field, so a later blank entry should look again
+        self._java_path_cache = None
+
+    def _detect_java(self):
         """
         Basic attempt to find Java across different platforms.
         Tries some common locations on macOS, or simply uses `shutil.which("java")`.
@@ -902,12 +1381,20 @@ class M1LauncherApp:
                 if os.path.isfile(path):
                     return path
                 elif os.path.isdir(path):
-                    for root, _, files in os.walk(path):
-                        if "bin" in root and "java" in files:
-                            return os.path.join(root, "java")
+                    # Only look where a JDK bundle keeps its launcher, highest Java version first
+                    hits = sorted(glob.glob(os.path.join(path, "*", "Contents", "Home", "bin", "java")), key=jdk_version, reverse=True)
+                    if hits:
+                        return hits[0]
         # Fallback
         return "java"
 
+    def _find_java_worker(self):
+        self.root.after(0, self._fill_default_java, self.find_java())
+
+    def _fill_default_java(self, java_path):
+        if not self.java_entry.get():
+            self.java_entry.insert(0, java_path)
+
     def browse_java(self):
         filename = filedialog.askopenfilename(
             title="Select Java Executable",
@@ -920,14 +1407,14 @@ class M1LauncherApp:
     # --------------------------- ACCOUNTS UI ---------------------------
 
     def on_add_account(self):
-        acc_type = self.acct_type_var.get()
+        acc_type = sys.intern(self.acct_type_var.get())
         user = self.username_entry.get().strip()
         pwd = self.password_entry.get().strip()
 
         if not user:
             messagebox.showwarning("Input Error", "Username/Email cannot be empty!")
             return
-        if acc_type == "tlauncher" and not pwd:
+        if acc_type == ACCT_TLAUNCHER and not pwd:
             result = messagebox.askyesno(
                 "Password Missing",
                 "You selected a TLauncher account but left the password empty. Continue anyway (treat as offline)?"
@@ -946,14 +1433,12 @@ class M1LauncherApp:
             self.set_status(f"Error adding account: {e}", "red")
 
     def refresh_account_list(self):
-        display_names = [f"{acc.get('type','N/A').capitalize()}: {acc.get('username','Unknown')}" for acc in accounts]
+        # accounts keeps its order across add/update, so the selected index stays valid
+        selected_idx = self.account_combo.current()
+        display_names = [account_display_name(acc) for acc in accounts.values()]
         self.account_combo['values'] = display_names
         if display_names:
-            current_selection = self.account_var.get()
-            if current_selection in display_names:
-                self.account_combo.set(current_selection)
-            else:
-                self.account_combo.current(0)
+            self.account_combo.current(min(selected_idx, len(display_names) - 1) if selected_idx >= 0 else 0)
         else:
             self.account_combo.set('')
 
@@ -973,7 +1458,7 @@ class M1LauncherApp:
             )
             if result:
                 selected_account = {
-                    "type": "offline",
+                    "type": ACCT_OFFLINE,
                     "username": "Player",
                     "uuid": str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, "Player")),
                     "token": "0"
@@ -984,31 +1469,28 @@ class M1LauncherApp:
             messagebox.showerror("Error", "Please select an account from the list.")
             return
         else:
-            selected_account = accounts[account_index]
+            selected_account = list(accounts.values())[account_index]
 
-        try:
-            ram_val = int(self.ram_spin.get())
-        except ValueError:
+        ram_str = self.ram_spin.get().strip()
+        if not ram_str.isdecimal():
             messagebox.showerror("Error", "Invalid RAM value. Please enter a number (MB).")
             return
+        ram_val = int(ram_str)
 
         java_path_val = self.java_entry.get().strip() or self.find_java()
         server_ip_val = self.server_entry.get().strip() or None
         port_val_str = self.port_entry.get().strip()
         port_val = None
         if port_val_str:
-            try:
-                port_val = int(port_val_str)
-                if not (0 < port_val < 65536):
-                    raise ValueError
-            except ValueError:
+            port_val = int(port_val_str) if port_val_str.isdecimal() else 0
+            if not (0 < port_val < 65536):
                 messagebox.showerror("Error", "Invalid Port number. Must be between 1 and 65535.")
                 return
 
         # Check if user selected a known modpack from the list
-        is_modpack = selected_version_display in getattr(self, "popular_modpacks", {})
-        modpack_slug = self.popular_modpacks.get(selected_version_display) if is_modpack else None
-        version_to_process = modpack_slug if is_modpack else selected_version_display
+        modpack_slug = self.popular_modpacks.get(selected_version_display)
+        is_modpack = modpack_slug is not None
+        version_to_process = modpack_slug or selected_version_display
 
         use_rosetta = self.use_rosetta_var.get()
         lunar_client = self.lunar_client_var.get()
@@ -1017,23 +1499,22 @@ class M1LauncherApp:
         self.launch_btn.config(state="disabled")
         self.set_status("Starting launch process...", "blue")
 
-        launch_thread = threading.Thread(
-            target=self._launch_task,
-            args=(
-                version_to_process,
-                is_modpack,
-                selected_account,
-                ram_val,
-                java_path_val,
-                server_ip_val,
-                port_val,
-                use_rosetta,
-                lunar_client,
-                ssl_verify
-            ),
-            daemon=True
-        )
-        launch_thread.start()
+        self._launch_q.put((
+            version_to_process,
+            is_modpack,
+            selected_account,
+            ram_val,
+            java_path_val,
+            server_ip_val,
+            port_val,
+            use_rosetta,
+            lunar_client,
+            ssl_verify
+        ))
+
+    def _launch_worker(self):
+        while True:
+            self._launch_task(*self._launch_q.get())
 
     def _launch_task(
         self,
@@ -1083,7 +1564,8 @@ class M1LauncherApp:
         except Exception as e:
             error_message = f"Error during launch: {e}"
             print(f"ERROR: {error_message}")
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
             self.set_status(f"Error: {e}", "red")
             self.root.after(0, messagebox.showerror, "Launch Failed", error_message)
         finally:
@@ -1092,18 +1574,19 @@ class M1LauncherApp:
     # --------------------------- STATUS HELPER ---------------------------
 
     def set_status(self, message, color="black"):
-        self.root.after(0, self._update_status_ui, message, color)
+        with self._status_lock:
+            self._pending_status = (message, color)
+
+    def _drain_status(self):
+        with self._status_lock:
+            latest, self._pending_status = self._pending_status, None
+        if latest is not None:
+            self._update_status_ui(*latest)
+        self.root.after(50, self._drain_status)
 
     def _update_status_ui(self, message, color):
         self.status_var.set(message)
-        # Attempt to set the label color in the bottom status bar
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Frame) and widget.cget('relief') == tk.SUNKEN:
-                for label in widget.winfo_children():
-                    if isinstance(label, ttk.Label):
-                        label.config(foreground=color)
-                        break
-                break
+        self.status_label.config(foreground=color)
 
 # ----------------------------------------------------------------------------------
 #                                  MAIN ENTRY
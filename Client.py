@@ -1,15 +1,33 @@
-import traceback
-import os, sys, json, shutil, zipfile, threading
-import urllib.request
+import os, sys, json, shutil, zipfile, threading, functools, hashlib, mmap, struct
+import queue
+import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import urllib.error
+import urllib.parse
+import http.client
+import contextlib
 import ssl
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
 import subprocess
-import uuid as uuidlib
 import platform
 
+try:
+    import orjson  # Optional: much faster decoding of version JSON and asset indexes
+except ImportError:
+    orjson = None
+
+try:
+    from isal import isal_zlib  # Optional: ISA-L inflate for the deflated members of natives jars
+except ImportError:
+    isal_zlib = None
+
+def json_load_file(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 # --- Constants ---
 USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/102.0.0.0 Safari/537.36"
 LUNAR_API_BASE = "https://api.lunarclientprod.com"
@@ -63,6 +81,7 @@ def save_accounts():
 
 def add_account(acc_type, email_username, password_token=None):
     if not email_username: return
+    import uuid as uuidlib  # only needed when an account is added
     offline_uuid = str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, email_username))
     acc = {
         "type": acc_type,
@@ -88,12 +107,9 @@ def fetch_lunar_cosmetics(uuid, ssl_verify=False):
         with open(cache_file, 'r') as f:
             return json.load(f)
     
-    headers = {"User-Agent": USER_AGENT}
     params = {"uuids": uuid}
     try:
-        context = get_ssl_context(ssl_verify)
-        req = urllib.request.Request(f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}", headers=headers)
-        with urllib.request.urlopen(req, context=context) as response:
+        with open_url(f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}", ssl_verify) as response:
             data = json.loads(response.read().decode())
             with open(cache_file, 'w') as f:
                 json.dump(data, f, indent=4)
@@ -105,31 +121,196 @@ def fetch_lunar_cosmetics(uuid, ssl_verify=False):
 def download_lunar_texture(url, dest_path, description="texture", ssl_verify=False):
     download_file(url, dest_path, description, ssl_verify)
 
+# --- HTTP Connection Pool ---
+# Keep-alive connections are reused per host, so a batch of asset downloads
+# pays for the TCP and TLS handshake once instead of once per file.
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 32  # matches DOWNLOAD_WORKERS
+_pool_lock = threading.Lock()
+_idle_connections = {}  # (scheme, host, ssl_verify) -> [idle connections]
+
+def _checkout_connection(scheme, host, ssl_verify):
+    key = (scheme, host, ssl_verify)
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return key, idle.pop()
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+    else:
+        conn = http.client.HTTPConnection(host, timeout=30)
+    return key, conn
+
+def _checkin_connection(key, conn):
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+def _request(url, ssl_verify, headers):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    key, conn = _checkout_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        return key, conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+        # The server dropped an idle keep-alive socket; retry on a fresh one
+        return _request(url, ssl_verify, headers)
+    except Exception:
+        conn.close()
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None):
+    # Follows redirects; non-2xx responses raise urllib.error.HTTPError like urlopen
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        key, conn, response = _request(url, ssl_verify, headers)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            _checkin_connection(key, conn)
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            _checkin_connection(key, conn)
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed():
+            _checkin_connection(key, conn)
+        else:
+            conn.close()
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
 # --- Download Helper ---
-def download_file(url, dest_path, description="file", ssl_verify=False):
+DOWNLOAD_BUFFER_SIZE = 256 * 1024  # bytes per read/write when copying a response to disk
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+
+def file_sha1(path):
+    # Hashing happens in C with the GIL released; big files are mapped rather than read
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha1(mm).hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha1").hexdigest()
+        h = hashlib.sha1()
+        for chunk in iter(lambda: f.read(DOWNLOAD_BUFFER_SIZE), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+# Set CATCLIENT_VERIFY=1 to SHA-1 check files already on disk instead of trusting their size
+VERIFY_EXISTING = os.environ.get("CATCLIENT_VERIFY", "0") == "1"
+
+def is_installed(path, size=None, sha1=None):
+    # One stat() per file on warm launches; a size mismatch means a truncated or stale copy
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return False
+    if size is not None and st.st_size != size:
+        return False
+    if VERIFY_EXISTING and sha1:
+        return file_sha1(path) == sha1.lower()
+    return True
+
+def download_file(url, dest_path, description="file", ssl_verify=False, sha1=None):
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
-    ssl_context = get_ssl_context(ssl_verify)
+    # Hash each chunk as it is written instead of re-reading the file afterwards, and only
+    # rename the .part file into place once it is complete and verified
+    part_path = dest_path + ".part"
     try:
         print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
-        with urllib.request.urlopen(req, context=ssl_context) as response, open(dest_path, 'wb') as out_file:
-            shutil.copyfileobj(response, out_file)
+        hasher = hashlib.sha1() if sha1 else None
+        with open_url(url, ssl_verify) as response, \
+                open(part_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as out_file:
+            while True:
+                chunk = response.read(DOWNLOAD_BUFFER_SIZE)
+                if not chunk:
+                    break
+                if hasher:
+                    hasher.update(chunk)
+                out_file.write(chunk)
+        if hasher and hasher.hexdigest() != sha1.lower():
+            raise Exception(f"SHA-1 mismatch (expected {sha1}, got {hasher.hexdigest()})")
+        os.replace(part_path, dest_path)
         print(f"Finished downloading {os.path.basename(dest_path)}")
     except Exception as e:
         raise Exception(f"Failed to download {description} from {url}: {e}")
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+# --- Parallel Downloads ---
+DOWNLOAD_WORKERS = 32
+PROGRESS_EVERY = 10  # completed files between status updates, so Tk is not flooded
+
+def download_all(jobs, label, status_callback=None, ssl_verify=False):
+    # jobs are (url, dest_path, description, sha1); a destination listed twice is fetched once
+    jobs = list({job[1]: job for job in jobs}.values())
+    total = len(jobs)
+    if not total: return
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, total)) as pool:
+        futures = [pool.submit(download_file, url, dest, desc, ssl_verify, sha1) for url, dest, desc, sha1 in jobs]
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if status_callback and (done % PROGRESS_EVERY == 0 or done == total):
+                    status_callback(f"Downloaded {done}/{total} {label}")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 # --- Version Manifest Loading ---
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
 all_versions = {}
 
+version_manifest_cache_path = version_manifest_path + ".pkl"
+
+def _read_version_manifest():
+    # Reuse the pickled parse from a previous run while the JSON it came from is unchanged
+    st = os.stat(version_manifest_path)
+    source_key = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(version_manifest_cache_path, 'rb') as f:
+            cached_key, version_manifest = pickle.load(f)
+        if cached_key == source_key:
+            return version_manifest
+    except Exception:
+        pass
+    version_manifest = json_load_file(version_manifest_path)
+    try:
+        tmp_path = version_manifest_cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((source_key, version_manifest), f, protocol=5)
+        os.replace(tmp_path, version_manifest_cache_path)
+    except OSError as e:
+        print(f"Warning: could not cache parsed version manifest: {e}")
+    return version_manifest
+
 def load_version_manifest(ssl_verify=False):
     global all_versions
     try:
         if not os.path.isfile(version_manifest_path):
             download_file("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json", 
                           version_manifest_path, "version manifest v2", ssl_verify)
-        with open(version_manifest_path, 'r') as f:
-            version_manifest = json.load(f)
+        version_manifest = _read_version_manifest()
         all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
         return version_manifest
     except Exception as e:
@@ -153,6 +334,56 @@ def run_with_rosetta(cmd):
     return cmd
 
 # --- Minecraft Installation Logic ---
+ZIP_BUFFER_SIZE = 32 * 1024
+
+def _inflate_member(jar_file, info):
+    # Raw deflate stream of one member inflated by ISA-L in a single call, or None to use zipfile
+    if isal_zlib is None or info.compress_type != zipfile.ZIP_DEFLATED or info.flag_bits & 0x1:
+        return None
+    jar_file.seek(info.header_offset)
+    header = jar_file.read(30)
+    if len(header) != 30 or header[:4] != b"PK\x03\x04":
+        return None
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    jar_file.seek(info.header_offset + 30 + name_len + extra_len)
+    try:
+        data = isal_zlib.decompress(jar_file.read(info.compress_size), -15)
+    except isal_zlib.error:
+        return None
+    if len(data) != info.file_size or isal_zlib.crc32(data) != info.CRC:
+        return None
+    return data
+
+def extract_natives(jar_path, natives_dir):
+    # Streams each member straight from the jar on disk through one shared 32 KiB buffer;
+    # zf.open() is already buffered, so it is not wrapped again
+    natives_root = os.path.abspath(natives_dir)
+    with open(jar_path, 'rb', buffering=ZIP_BUFFER_SIZE) as jar_file, zipfile.ZipFile(jar_file) as zf:
+        for info in zf.infolist():
+            if info.filename.startswith("META-INF/") or info.is_dir():
+                continue
+            dest = os.path.normpath(os.path.join(natives_root, info.filename))
+            if not dest.startswith(natives_root + os.sep):
+                continue  # never write outside natives_dir
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            data = _inflate_member(jar_file, info)
+            if data is not None:
+                with open(dest, 'wb') as dst:
+                    dst.write(data)
+                continue
+            with zf.open(info) as src, open(dest, 'wb', buffering=ZIP_BUFFER_SIZE) as dst:
+                shutil.copyfileobj(src, dst, ZIP_BUFFER_SIZE)
+
+@functools.lru_cache(maxsize=32)
+def _parse_version_json(path, mtime_ns, size):
+    return json_load_file(path)
+
+def load_version_json(version_id):
+    # Parsed once per file state: a re-downloaded or edited file has a new mtime/size key
+    path = os.path.join(VERSIONS_DIR, version_id, f"{version_id}.json")
+    st = os.stat(path)
+    return _parse_version_json(path, st.st_mtime_ns, st.st_size)
+
 def install_version(version_id, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"Checking version: {version_id}...")
     version_folder = os.path.join(VERSIONS_DIR, version_id)
@@ -167,28 +398,26 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
         if status_callback: status_callback(f"Downloading version JSON for {version_id}...")
         download_file(version_url, version_json_path, f"version JSON ({version_id})", ssl_verify)
 
-    with open(version_json_path, 'r') as f:
-        version_data = json.load(f)
+    version_data = load_version_json(version_id)
 
     parent_id = version_data.get("inheritsFrom")
     parent_data = {}
     if parent_id:
         if status_callback: status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...")
         install_version(parent_id, status_callback, ssl_verify)
-        parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
+        parent_data = load_version_json(parent_id)
 
     client_info = version_data.get("downloads", {}).get("client")
-    if client_info and not os.path.isfile(version_jar_path):
+    if client_info and not is_installed(version_jar_path, client_info.get("size"), client_info.get("sha1")):
         client_url = client_info.get("url")
         if client_url:
             if status_callback: status_callback(f"Downloading client JAR for {version_id}...")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
+            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify, client_info.get("sha1"))
 
     libraries = version_data.get("libraries", []) + parent_data.get("libraries", [])
-    total_libs = len(libraries)
-    for i, lib in enumerate(libraries):
+    lib_jobs = []
+    native_paths = []
+    for lib in libraries:
         rules = lib.get("rules", [])
         allowed = not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
         if not allowed: continue
@@ -196,10 +425,9 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
         artifact = lib.get("downloads", {}).get("artifact")
         if artifact and artifact.get("path"):
             lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
-            if not os.path.isfile(lib_path):
+            if not is_installed(lib_path, artifact.get("size"), artifact.get("sha1")):
                 lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
-                if status_callback: status_callback(f"Downloading library {i+1}/{total_libs}: {os.path.basename(lib_path)}")
-                download_file(lib_url, lib_path, f"library ({os.path.basename(lib_path)})", ssl_verify)
+                lib_jobs.append((lib_url, lib_path, f"library ({os.path.basename(lib_path)})", artifact.get("sha1")))
 
         natives_info = lib.get("natives")
         classifiers = lib.get("downloads", {}).get("classifiers", {})
@@ -208,39 +436,40 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
             if native_key in classifiers:
                 native_artifact = classifiers[native_key]
                 native_path = os.path.join(LIBRARIES_DIR, native_artifact["path"])
-                if not os.path.isfile(native_path):
+                if not is_installed(native_path, native_artifact.get("size"), native_artifact.get("sha1")):
                     native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
-                    if status_callback: status_callback(f"Downloading native library {i+1}/{total_libs}: {os.path.basename(native_path)}")
-                    download_file(native_url, native_path, f"native library ({os.path.basename(native_path)})", ssl_verify)
-                natives_dir = os.path.join(version_folder, "natives")
-                os.makedirs(natives_dir, exist_ok=True)
-                with zipfile.ZipFile(native_path, 'r') as zf:
-                    for member in zf.namelist():
-                        if not member.startswith("META-INF/") and not member.endswith('/'):
-                            zf.extract(member, natives_dir)
+                    lib_jobs.append((native_url, native_path, f"native library ({os.path.basename(native_path)})", native_artifact.get("sha1")))
+                native_paths.append(native_path)
+
+    if lib_jobs and status_callback: status_callback(f"Downloading {len(lib_jobs)} libraries for {version_id}...")
+    download_all(lib_jobs, "libraries", status_callback, ssl_verify)
+
+    if native_paths:
+        natives_dir = os.path.join(version_folder, "natives")
+        os.makedirs(natives_dir, exist_ok=True)
+        for native_path in native_paths:
+            extract_natives(native_path, natives_dir)
 
     asset_index_info = version_data.get("assetIndex") or parent_data.get("assetIndex")
     if asset_index_info:
         idx_id = asset_index_info["id"]
         idx_url = asset_index_info["url"]
         idx_dest = os.path.join(ASSETS_DIR, "indexes", f"{idx_id}.json")
-        if not os.path.isfile(idx_dest):
+        if not is_installed(idx_dest, asset_index_info.get("size"), asset_index_info.get("sha1")):
             if status_callback: status_callback(f"Downloading asset index {idx_id}...")
-            download_file(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify)
+            download_file(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify, asset_index_info.get("sha1"))
 
-        with open(idx_dest, 'r') as f:
-            idx_data = json.load(f)
-        total_assets = len(idx_data["objects"])
-        assets_downloaded = 0
+        idx_data = json_load_file(idx_dest)
+        asset_jobs = []
         for asset_name, info in idx_data["objects"].items():
             hash_val = info.get("hash")
             if hash_val:
                 subdir = hash_val[:2]
                 asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
-                if not os.path.isfile(asset_path):
-                    assets_downloaded += 1
-                    if status_callback: status_callback(f"Downloading asset {assets_downloaded}/{total_assets}: {asset_name}")
-                    download_file(ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", ssl_verify)
+                if not is_installed(asset_path, info.get("size"), hash_val):
+                    asset_jobs.append((ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", hash_val))
+        if asset_jobs and status_callback: status_callback(f"Downloading {len(asset_jobs)}/{len(idx_data['objects'])} assets...")
+        download_all(asset_jobs, "assets", status_callback, ssl_verify)
 
     if status_callback: status_callback(f"Version {version_id} installation complete.")
 
@@ -280,27 +509,43 @@ def setup_lunar_client(version_id, account, status_callback=None, ssl_verify=Fal
     if status_callback: status_callback(f"Lunar Client setup complete for {version_id}")
 
 # --- Game Launch Logic ---
+# Built launch commands, reused while the launch settings and the version JSON files
+# they were built from are unchanged; a reinstall rewrites the JSON and misses the cache
+_launch_commands = {}
+
+def _file_state(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=None, server_ip=None, port=None, 
                status_callback=None, use_rosetta=False, lunar_client=False, ssl_verify=False):
     if status_callback: status_callback(f"Preparing to launch {version_id}...")
     effective_game_dir = game_dir or mc_dir
     if lunar_client:
         setup_lunar_client(version_id, account, status_callback, ssl_verify)
+
+    cache_key = (version_id, account["type"], account["username"], account["uuid"], account["token"],
+                 ram_mb, java_path, effective_game_dir, server_ip, port, use_rosetta, lunar_client)
+    cached = _launch_commands.get(cache_key)
+    if cached and all(_file_state(path) == state for path, state in cached[1]):
+        if status_callback: status_callback(f"Launching Minecraft {version_id}...")
+        subprocess.Popen(cached[0], cwd=effective_game_dir)
+        return
+
     install_version(version_id, status_callback, ssl_verify)
 
     version_folder = os.path.join(VERSIONS_DIR, version_id)
-    version_json_path = os.path.join(version_folder, f"{version_id}.json")
-    with open(version_json_path, 'r') as f:
-        vdata = json.load(f)
+    vdata = load_version_json(version_id)
 
     main_class = vdata.get("mainClass")
     classpath = set()
     natives_dir_absolute = os.path.abspath(os.path.join(version_folder, "natives"))
     parent_data = {}
     if vdata.get("inheritsFrom"):
-        parent_json_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
+        parent_data = load_version_json(vdata["inheritsFrom"])
         main_class = main_class or parent_data.get("mainClass")
 
     for lib in vdata.get("libraries", []) + parent_data.get("libraries", []):
@@ -364,13 +609,28 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
     if use_rosetta:
         command = run_with_rosetta(command)
 
+    sources = [os.path.join(VERSIONS_DIR, version_id, f"{version_id}.json")]
+    if vdata.get("inheritsFrom"):
+        sources.append(os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.json"))
+    _launch_commands[cache_key] = (command, [(path, _file_state(path)) for path in sources])
     if status_callback: status_callback(f"Launching Minecraft {version_id}...")
     subprocess.Popen(command, cwd=effective_game_dir)
 
 # --- GUI (Original Layout) ---
 class M1LauncherApp:
+    # Display name -> modpack slug; fixed, so built once rather than on every list refresh
+    POPULAR_MODPACKS = {
+        "RLCraft (Modpack)": "rlcraft",
+        "All the Mods 9 (Modpack)": "all-the-mods-9-atm9",
+        "Pixelmon Modpack (Modpack)": "the-pixelmon-modpack",
+        "One Block MC (Modpack)": "one-block-mc",
+        "DawnCraft (Modpack)": "dawncraft",
+        "Better MC (Modpack)": "better-mc-bmc1-forge",
+    }
+
     def __init__(self, root):
         self.root = root
+        self.popular_modpacks = self.POPULAR_MODPACKS
         self.root.title("M1 Minecraft Launcher v1.2 (Lunar Compatible)")
         self.root.geometry("650x680")
         
@@ -438,7 +698,9 @@ class M1LauncherApp:
         self.ram_spin.grid(row=0, column=1, pady=3, sticky="w")
         ttk.Label(options_frame, text="Java Path:").grid(row=1, column=0, padx=5, pady=3, sticky="e")
         self.java_entry = ttk.Entry(options_frame, width=40)
+        self._java_path_cache = None
         self.java_entry.insert(0, self.find_java())
+        self.java_entry.bind("<FocusOut>", self._forget_java_path)
         self.java_entry.grid(row=1, column=1, padx=5, pady=3, sticky="we")
         ttk.Button(options_frame, text="Browse...", command=self.browse_java).grid(row=1, column=2, padx=5)
         ttk.Label(options_frame, text="Server IP (Optional):").grid(row=2, column=0, padx=5, pady=3, sticky="e")
@@ -453,7 +715,14 @@ class M1LauncherApp:
         self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Frame(root, relief=tk.SUNKEN, padding="2 2 2 2")
         status_bar.pack(side=tk.BOTTOM, fill="x")
-        ttk.Label(status_bar, textvariable=self.status_var).pack(side=tk.LEFT)
+        self.status_label = ttk.Label(status_bar, textvariable=self.status_var)
+        self.status_label.pack(side=tk.LEFT)
+        # Workers only record the latest status and post dialogs to ui_queue; the Tk
+        # thread picks both up at most every 50 ms, so no widget is touched off-thread
+        self._status_lock = threading.Lock()
+        self._pending_status = None
+        self.ui_queue = queue.Queue()
+        self.root.after(50, self._drain_ui)
 
         # Launch Button
         launch_frame = ttk.Frame(root)
@@ -487,14 +756,6 @@ class M1LauncherApp:
             release_versions = sorted([v['id'] for v in self.version_manifest['versions'] if v['type'] == 'release'], reverse=True)
             snapshot_versions = sorted([v['id'] for v in self.version_manifest['versions'] if v['type'] == 'snapshot'], reverse=True)
             custom_versions = [item for item in os.listdir(VERSIONS_DIR) if os.path.isdir(os.path.join(VERSIONS_DIR, item)) and item not in all_versions]
-            self.popular_modpacks = {
-                "RLCraft (Modpack)": "rlcraft",
-                "All the Mods 9 (Modpack)": "all-the-mods-9-atm9",
-                "Pixelmon Modpack (Modpack)": "the-pixelmon-modpack",
-                "One Block MC (Modpack)": "one-block-mc",
-                "DawnCraft (Modpack)": "dawncraft",
-                "Better MC (Modpack)": "better-mc-bmc1-forge",
-            }
             modpack_names = sorted(self.popular_modpacks.keys())
             combined_list = modpack_names + sorted(custom_versions, reverse=True) + release_versions + snapshot_versions
             self.version_combo['values'] = combined_list
@@ -507,6 +768,16 @@ class M1LauncherApp:
             self.set_status(f"Error populating version list: {e}", "red")
 
     def find_java(self):
+        # Detection walks several JDK folders; do it once and reuse the answer on every launch
+        if self._java_path_cache is None:
+            self._java_path_cache = self._detect_java()
+        return self._java_path_cache
+
+    def _forget_java_path(self, event=None):
+        # The user edited the Java field, so a later blank entry should look again
+        self._java_path_cache = None
+
+    def _detect_java(self):
         java_locations = [
             "/usr/bin/java",
             "/Library/Java/JavaVirtualMachines",
@@ -532,17 +803,30 @@ class M1LauncherApp:
             self.java_entry.insert(0, filename)
 
     def set_status(self, message, color="black"):
-        self.root.after(0, self._update_status_ui, message, color)
+        with self._status_lock:
+            self._pending_status = (message, color)
+
+    def _drain_ui(self):
+        with self._status_lock:
+            latest, self._pending_status = self._pending_status, None
+        if latest is not None:
+            self._update_status_ui(*latest)
+        while True:
+            try:
+                kind, *payload = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "error":
+                messagebox.showerror(*payload)
+            elif kind == "info":
+                messagebox.showinfo(*payload)
+            elif kind == "launch_done":
+                self.launch_btn.config(state="normal")
+        self.root.after(50, self._drain_ui)
 
     def _update_status_ui(self, message, color):
         self.status_var.set(message)
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Frame) and widget.cget('relief') == tk.SUNKEN:
-                for label in widget.winfo_children():
-                    if isinstance(label, ttk.Label):
-                        label.config(foreground=color)
-                        break
-                break
+        self.status_label.config(foreground=color)
 
     def on_add_account(self):
         acc_type = self.acct_type_var.get()
@@ -577,32 +861,43 @@ class M1LauncherApp:
             self.account_combo.set('')
 
     def on_launch(self):
+        # Every widget is read exactly once, here on the Tk thread; the worker only sees plain values
         selected_version_display = self.version_var.get()
+        account_index = self.account_combo.current()
+        ram_text = self.ram_spin.get()
+        java_text = self.java_entry.get().strip()
+        server_text = self.server_entry.get().strip()
+        port_val_str = self.port_entry.get().strip()
+        use_rosetta = self.use_rosetta_var.get()
+        lunar_client = self.lunar_client_var.get()
+        ssl_verify = self.ssl_verify_var.get()
+        accts = accounts
+        modpacks = self.popular_modpacks
+
         if not selected_version_display:
             messagebox.showerror("Error", "Please select a version or modpack.")
             return
-        account_index = self.account_combo.current()
-        if account_index == -1 and not accounts:
+        if account_index == -1 and not accts:
             result = messagebox.askyesno("No Account Selected", "No accounts configured. Launch in Offline mode with username 'Player'?")
             if result:
+                import uuid as uuidlib  # only needed for the offline fallback
                 selected_account = {"type": "offline", "username": "Player", "uuid": str(uuidlib.uuid3(uuidlib.NAMESPACE_DNS, "Player")), "token": "0"}
             else:
                 return
-        elif account_index == -1 and accounts:
+        elif account_index == -1 and accts:
             messagebox.showerror("Error", "Please select an account from the list.")
             return
         else:
-            selected_account = accounts[account_index]
+            selected_account = accts[account_index]
 
         try:
-            ram_val = int(self.ram_spin.get())
+            ram_val = int(ram_text)
         except ValueError:
             messagebox.showerror("Error", "Invalid RAM value. Please enter a number (MB).")
             return
 
-        java_path_val = self.java_entry.get().strip() or self.find_java()
-        server_ip_val = self.server_entry.get().strip() or None
-        port_val_str = self.port_entry.get().strip()
+        java_path_val = java_text or self.find_java()
+        server_ip_val = server_text or None
         port_val = None
         if port_val_str:
             try:
@@ -612,13 +907,9 @@ class M1LauncherApp:
                 messagebox.showerror("Error", "Invalid Port number. Must be between 1 and 65535.")
                 return
 
-        is_modpack = selected_version_display in self.popular_modpacks
-        modpack_slug = self.popular_modpacks.get(selected_version_display) if is_modpack else None
-        version_to_process = modpack_slug if is_modpack else selected_version_display
-
-        use_rosetta = self.use_rosetta_var.get()
-        lunar_client = self.lunar_client_var.get()
-        ssl_verify = self.ssl_verify_var.get()
+        modpack_slug = modpacks.get(selected_version_display)
+        is_modpack = modpack_slug is not None
+        version_to_process = modpack_slug or selected_version_display
 
         self.launch_btn.config(state="disabled")
         self.set_status("Starting launch process...", "blue")
@@ -638,9 +929,8 @@ class M1LauncherApp:
             game_directory = None
             if is_modpack:
                 self.set_status(f"Installing modpack '{item_to_launch}'...", "blue")
-                messagebox.showinfo("Modpack Support", "Modpack installation not fully implemented yet.")
+                self.ui_queue.put(("info", "Modpack Support", "Modpack installation not fully implemented yet."))
                 self.set_status("Ready", "black")
-                self.root.after(0, self.launch_btn.config, {"state": "normal"})
                 return
             else:
                 final_version_id = item_to_launch
@@ -664,11 +954,12 @@ class M1LauncherApp:
         except Exception as e:
             error_message = f"Error during launch: {e}"
             print(f"ERROR: {error_message}")
+            import traceback  # error path only
             traceback.print_exc()
             self.set_status(f"Error: {e}", "red")
-            self.root.after(0, messagebox.showerror, "Launch Failed", error_message)
+            self.ui_queue.put(("error", "Launch Failed", error_message))
         finally:
-            self.root.after(0, self.launch_btn.config, {"state": "normal"})
+            self.ui_queue.put(("launch_done",))
 
 if __name__ == "__main__":
     try:
@@ -677,6 +968,7 @@ if __name__ == "__main__":
         root.mainloop()
     except Exception as e:
         print(f"Fatal error: {e}")
+        import traceback
         traceback.print_exc()
         if 'root' in locals() and root:
             messagebox.showerror("Fatal Error", f"A fatal error occurred: {e}")
\ No newline at end of file
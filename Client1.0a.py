@@ -1,14 +1,32 @@
 import traceback
-import os, sys, json, shutil, zipfile, threading
-import urllib.request
+import os, sys, json, shutil, zipfile, threading, hashlib, functools, time, collections
+import mmap, struct, zlib
+import urllib.parse
 import urllib.error
+import http.client
+import contextlib
 import ssl
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
+import glob
 import subprocess
 import uuid as uuidlib
 import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import ijson  # Optional: streams asset indexes instead of loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: much faster decoding of version JSON and asset indexes
+except ImportError:
+    orjson = None
+
+def json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 # --- Constants ---
 USER_AGENT = "Mozilla/5.0 (Macintosh; Apple Silicon Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/102.0.0.0 Safari/537.36"
@@ -33,6 +51,7 @@ VERSIONS_DIR = os.path.join(mc_dir, "versions")
 ASSETS_DIR = os.path.join(mc_dir, "assets")
 MODPACKS_DIR = os.path.join(mc_dir, "modpacks")
 LIBRARIES_DIR = os.path.join(mc_dir, "libraries")
+LIBRARIES_ABS = os.path.abspath(LIBRARIES_DIR)
 LUNAR_CACHE_DIR = os.path.join(mc_dir, "lunar_cache")
 TLAUNCHER_SKINS_DIR = os.path.join(mc_dir, "tlauncher_skins")
 
@@ -56,10 +75,29 @@ if os.path.isfile(accounts_file):
         print(f"Warning: Error loading accounts: {e}")
         accounts = []
 
+# (type, username) -> position in accounts, so add_account never scans the list
+_accounts_index = {}
+for _i, _acc in enumerate(accounts):
+    _accounts_index.setdefault((_acc.get("type"), _acc.get("username")), _i)
+
+def _serialize_accounts():
+    return json.dumps(accounts, separators=(',', ':'))
+
+# What is on disk, so save_accounts can skip rewriting an unchanged list
+_saved_accounts = _serialize_accounts()
+
 def save_accounts():
+    global _saved_accounts
+    serialized = _serialize_accounts()
+    if serialized == _saved_accounts and os.path.isfile(accounts_file):
+        return
+    # Write a temp file and swap it in, so a crash mid-write never truncates the saved accounts
+    tmp_path = accounts_file + ".tmp"
     try:
-        with open(accounts_file, 'w') as f:
-            json.dump(accounts, f, indent=4)
+        with open(tmp_path, 'w') as f:
+            f.write(serialized)
+        os.replace(tmp_path, accounts_file)
+        _saved_accounts = serialized
     except Exception as e:
         print(f"Error saving accounts: {e}")
 
@@ -73,35 +111,59 @@ def add_account(acc_type, email_username, password_token=None):
         "token": password_token or "null" if acc_type in ["tlauncher", "microsoft"] else "0",
         "client": "lunar" if acc_type == "lunar" else None
     }
-    for i, existing_acc in enumerate(accounts):
-        if existing_acc.get("type") == acc_type and existing_acc.get("username") == email_username:
-            accounts[i] = acc
-            save_accounts()
-            print(f"Account '{email_username}' ({acc_type}) updated.")
-            return
+    key = (acc_type, email_username)
+    i = _accounts_index.get(key)
+    if i is not None:
+        accounts[i] = acc
+        save_accounts()
+        print(f"Account '{email_username}' ({acc_type}) updated.")
+        return
+    _accounts_index[key] = len(accounts)
     accounts.append(acc)
     save_accounts()
     print(f"Account '{email_username}' ({acc_type}) added.")
 
 # --- Cosmetics Functions (Lunar + TLauncher) ---
+COSMETICS_CACHE_TTL = 6 * 3600  # seconds a cached cosmetics response stays fresh
+COSMETICS_CACHE_MAX_ENTRIES = 128
+
+def _evict_cosmetics_cache():
+    # Drop the least recently used entries; hits bump the access time, not the mtime
+    entries = [e for e in os.scandir(LUNAR_CACHE_DIR) if e.name.endswith("_cosmetics.json") and e.is_file()]
+    if len(entries) <= COSMETICS_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda e: e.stat().st_atime)
+    for entry in entries[:len(entries) - COSMETICS_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
 def fetch_lunar_cosmetics(uuid, ssl_verify=False):
     cache_file = os.path.join(LUNAR_CACHE_DIR, f"{uuid}_cosmetics.json")
-    if os.path.isfile(cache_file):
-        with open(cache_file, 'r') as f:
-            return json.load(f)
-    
-    headers = {"User-Agent": USER_AGENT}
+    try:
+        st = os.stat(cache_file)
+    except OSError:
+        st = None
+    if st and time.time() - st.st_mtime < COSMETICS_CACHE_TTL:
+        os.utime(cache_file, (time.time(), st.st_mtime))
+        with open(cache_file, 'rb') as f:
+            return json_loads(f.read())
+
     params = {"uuids": uuid}
     try:
-        context = get_ssl_context(ssl_verify)
-        req = urllib.request.Request(f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}", headers=headers)
-        with urllib.request.urlopen(req, context=context) as response:
+        with open_url(f"{LUNAR_COSMETICS_ENDPOINT}?{urllib.parse.urlencode(params)}", ssl_verify) as response:
             data = json.loads(response.read().decode())
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=4)
-            return data
+        with open(cache_file, 'w') as f:
+            json.dump(data, f, indent=4)
+        _evict_cosmetics_cache()
+        return data
     except Exception as e:
         print(f"Failed to fetch Lunar cosmetics for UUID {uuid}: {e}")
+        if st:
+            # A stale answer beats none when the API is unreachable
+            with open(cache_file, 'r') as f:
+                return json.load(f)
         return {}
 
 def fetch_tlauncher_skin(username, ssl_verify=False):
@@ -120,52 +182,322 @@ def fetch_tlauncher_skin(username, ssl_verify=False):
         print(f"Failed to fetch TLauncher skin/cape for {username}: {e}")
         return None, None
 
-def download_file(url, dest_path, description="file", ssl_verify=False):
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
-    ssl_context = get_ssl_context(ssl_verify)
+# --- HTTP Connection Pool ---
+# Keep-alive connections are reused per host, so a batch of asset downloads
+# pays for the TCP and TLS handshake once instead of once per file.
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 32
+_pool_lock = threading.Lock()
+_idle_connections = {}  # (scheme, host, ssl_verify) -> [idle connections]
+
+def _checkout_connection(scheme, host, ssl_verify):
+    key = (scheme, host, ssl_verify)
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return key, idle.pop()
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=30, context=get_ssl_context(ssl_verify))
+    else:
+        conn = http.client.HTTPConnection(host, timeout=30)
+    return key, conn
+
+def _checkin_connection(key, conn):
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+def _request(url, ssl_verify, headers):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    key, conn = _checkout_connection(parts.scheme, parts.netloc, ssl_verify)
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        return key, conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+        # The server dropped an idle keep-alive socket; retry on a fresh one
+        return _request(url, ssl_verify, headers)
+    except Exception:
+        conn.close()
+        raise
+
+@contextlib.contextmanager
+def open_url(url, ssl_verify=False, headers=None):
+    # Follows redirects; non-2xx responses raise urllib.error.HTTPError like urlopen
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        key, conn, response = _request(url, ssl_verify, headers)
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            response.read()
+            _checkin_connection(key, conn)
+            url = urllib.parse.urljoin(url, response.getheader("Location"))
+            continue
+        if not 200 <= response.status < 300:
+            response.read()
+            _checkin_connection(key, conn)
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed():
+            _checkin_connection(key, conn)
+        else:
+            conn.close()
+        return
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+COPY_BUFFER_SIZE = 1 << 20
+
+def download_file(url, dest_path, description="file", ssl_verify=False, expected_sha1=None, skip_mkdir=False, headers=None):
+    if not skip_mkdir:
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    # Stream into a side file and only rename it into place once it is complete
+    # (and, with expected_sha1, verified), so a bad download is never left behind
+    part_path = dest_path + ".part"
     try:
         print(f"Downloading {description}: {os.path.basename(dest_path)} from {url}")
-        with urllib.request.urlopen(req, context=ssl_context) as response, open(dest_path, 'wb') as out_file:
-            shutil.copyfileobj(response, out_file)
+        hasher = hashlib.sha1() if expected_sha1 else None
+        with open_url(url, ssl_verify, headers) as response, open(part_path, 'wb') as out_file:
+            response_headers = response.headers
+            while True:
+                chunk = response.read(COPY_BUFFER_SIZE)
+                if not chunk:
+                    break
+                if hasher:
+                    hasher.update(chunk)
+                out_file.write(chunk)
+        if hasher and hasher.hexdigest() != expected_sha1.lower():
+            raise Exception(f"SHA-1 mismatch (expected {expected_sha1}, got {hasher.hexdigest()})")
+        os.replace(part_path, dest_path)
         print(f"Finished downloading {os.path.basename(dest_path)}")
+        return response_headers
+    except urllib.error.HTTPError as e:
+        # A conditional request answered with 304 leaves the existing file in place
+        if e.code == 304 and headers:
+            print(f"{os.path.basename(dest_path)} is up to date")
+            return None
+        raise Exception(f"Failed to download {description} from {url}: {e}")
     except Exception as e:
         raise Exception(f"Failed to download {description} from {url}: {e}")
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+def download_file_cached(url, dest_path, description="file", ssl_verify=False, expected_sha1=None):
+    # Revalidates dest_path with the ETag/Last-Modified saved beside it in dest_path + ".etag"
+    validators_path = dest_path + ".etag"
+    headers = {}
+    if os.path.isfile(dest_path):
+        try:
+            with open(validators_path, 'r') as f:
+                validators = json.load(f)
+            if validators.get("etag"): headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"): headers["If-Modified-Since"] = validators["last_modified"]
+        except (OSError, ValueError):
+            pass
+    response_headers = download_file(url, dest_path, description, ssl_verify, expected_sha1, headers=headers)
+    if response_headers is None:
+        os.utime(dest_path)
+        return
+    validators = {"etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")}
+    if any(validators.values()):
+        with open(validators_path, 'w') as f:
+            json.dump(validators, f)
+    elif os.path.exists(validators_path):
+        os.remove(validators_path)
+
+# --- Parallel Downloads ---
+DOWNLOAD_WORKERS = 32
+
+def download_many(jobs, label, status_callback=None, ssl_verify=False, skip_mkdir=False):
+    # jobs are (url, dest_path, description, sha1); duplicate destinations are fetched once
+    jobs = list({job[1]: job for job in jobs}.values())
+    total = len(jobs)
+    if not total: return
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, total)) as pool:
+        futures = {pool.submit(download_file, url, dest, desc, ssl_verify, sha1, skip_mkdir): dest for url, dest, desc, sha1 in jobs}
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if status_callback: status_callback(f"Downloaded {label} {done}/{total}: {os.path.basename(futures[future])}")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 # --- Version Manifest Loading ---
 version_manifest_path = os.path.join(mc_dir, "version_manifest_v2.json")
 all_versions = {}
 
-def load_version_manifest(ssl_verify=False):
+MANIFEST_MAX_AGE = 3600  # seconds before the cached manifest is revalidated
+
+def load_version_manifest(ssl_verify=False, max_age=MANIFEST_MAX_AGE):
     global all_versions
     try:
-        if not os.path.isfile(version_manifest_path):
-            download_file(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify)
-        with open(version_manifest_path, 'r') as f:
-            version_manifest = json.load(f)
+        try:
+            cached_age = time.time() - os.path.getmtime(version_manifest_path)
+        except OSError:
+            cached_age = None
+        if cached_age is None or cached_age >= max_age:
+            try:
+                download_file_cached(VERSION_MANIFEST_URL, version_manifest_path, "version manifest", ssl_verify)
+            except Exception as e:
+                if cached_age is None:
+                    raise
+                print(f"Warning: could not refresh version manifest, using cached copy: {e}")
+        with open(version_manifest_path, 'rb') as f:
+            version_manifest = json_loads(f.read())
         all_versions = {v['id']: v['url'] for v in version_manifest['versions']}
         return version_manifest
     except Exception as e:
         print(f"Error loading version manifest: {e}")
         return {"versions": []}
 
-# --- M1 Mac Specific Functions ---
-def is_arm64():
-    return platform.machine() == 'arm64'
+def iter_asset_index(idx_path):
+    # orjson decodes the whole index faster than ijson can stream it
+    if orjson is not None or ijson is None:
+        with open(idx_path, 'rb') as f:
+            yield from json_loads(f.read())["objects"].items()
+    else:
+        with open(idx_path, 'rb') as f:
+            yield from ijson.kvitems(f, 'objects')
 
-def detect_rosetta():
+# --- M1 Mac Specific Functions ---
+def _detect_rosetta_once():
     try:
         result = subprocess.run(['sysctl', '-n', 'sysctl.proc_translated'], capture_output=True, text=True)
         return result.stdout.strip() == '1'
     except:
         return False
 
+# Neither can change while the launcher runs, so probe them once at import
+IS_ARM64 = platform.machine() == 'arm64'
+HAS_ROSETTA = _detect_rosetta_once()
+
+def is_arm64():
+    return IS_ARM64
+
+def detect_rosetta():
+    return HAS_ROSETTA
+
 def run_with_rosetta(cmd):
-    if is_arm64() and not detect_rosetta():
+    if IS_ARM64 and not HAS_ROSETTA:
         return ['arch', '-x86_64'] + cmd
     return cmd
 
+def _stored_member_data(mm, info):
+    # Slice of the jar holding an uncompressed member's bytes, or None if it must be decompressed
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    header = mm[info.header_offset:info.header_offset + 30]
+    if len(header) != 30 or header[:4] != b"PK\x03\x04":
+        return None
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    start = info.header_offset + 30 + name_len + extra_len
+    data = memoryview(mm)[start:start + info.file_size]
+    if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+        data.release()
+        return None
+    return data
+
+def extract_natives(jar_path, natives_dir):
+    # One pass over the central directory, streaming each member out in 1 MiB chunks;
+    # stored (uncompressed) members are written straight from a memory map of the jar
+    natives_root = os.path.abspath(natives_dir)
+    made_dirs = set()
+    with open(jar_path, 'rb') as jar_file, zipfile.ZipFile(jar_file, 'r') as zf, \
+            mmap.mmap(jar_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for info in zf.infolist():
+            if info.filename.startswith("META-INF/") or info.is_dir():
+                continue
+            dest = os.path.normpath(os.path.join(natives_root, info.filename))
+            if not dest.startswith(natives_root + os.sep):
+                continue  # never write outside natives_dir
+            parent = os.path.dirname(dest)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
+            data = _stored_member_data(mm, info)
+            if data is not None:
+                with data, open(dest, 'wb') as dst:
+                    dst.write(data)
+                continue
+            with zf.open(info) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
 # --- Minecraft Installation Logic ---
+@functools.lru_cache(maxsize=32)
+def _parse_version_json(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+def list_object_dir(subdir):
+    # Downloads land via rename, so any regular file under objects/xx is a complete asset
+    try:
+        with os.scandir(os.path.join(ASSETS_DIR, "objects", subdir)) as it:
+            return {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        return set()
+
+def load_version_json(version_id):
+    # Keyed on mtime and size so a re-downloaded or patched file is parsed again
+    path = os.path.join(VERSIONS_DIR, version_id, f"{version_id}.json")
+    st = os.stat(path)
+    return _parse_version_json(path, st.st_mtime_ns, st.st_size)
+
+LibEntry = collections.namedtuple("LibEntry", "path url sha1 native_path native_url native_sha1")
+_libraries_cache = {}  # (id(version_data), id(parent_data)) -> (version_data, parent_data, entries)
+
+def flatten_libraries(version_data, parent_data=None):
+    # One pass over a version's (and its parent's) libraries, keeping only those allowed
+    # on macOS; install_version and launch_game share the result for the same parsed JSON
+    parent_data = parent_data or None
+    key = (id(version_data), id(parent_data))
+    cached = _libraries_cache.get(key)
+    if cached and cached[0] is version_data and cached[1] is parent_data:
+        return cached[2]
+
+    entries = []
+    for lib in version_data.get("libraries", []) + (parent_data.get("libraries", []) if parent_data else []):
+        rules = lib.get("rules")
+        if rules and not any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules):
+            continue
+        downloads = lib.get("downloads", {})
+        path = url = sha1 = native_path = native_url = native_sha1 = None
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("path"):
+            path = os.path.join(LIBRARIES_ABS, artifact["path"])
+            url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
+            sha1 = artifact.get("sha1")
+        natives_info = lib.get("natives")
+        classifiers = downloads.get("classifiers", {})
+        if natives_info and classifiers:
+            native_key = 'natives-osx-arm64' if IS_ARM64 and 'natives-osx-arm64' in classifiers else natives_info.get('osx', '').replace("${arch}", "64")
+            if native_key in classifiers:
+                native_artifact = classifiers[native_key]
+                native_path = os.path.join(LIBRARIES_ABS, native_artifact["path"])
+                native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
+                native_sha1 = native_artifact.get("sha1")
+        if path or native_path:
+            entries.append(LibEntry(path, url, sha1, native_path, native_url, native_sha1))
+
+    if len(_libraries_cache) >= 32:
+        _libraries_cache.clear()
+    _libraries_cache[key] = (version_data, parent_data, entries)
+    return entries
+
 def install_version(version_id, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"Checking version: {version_id}...")
     version_folder = os.path.join(VERSIONS_DIR, version_id)
@@ -180,91 +512,80 @@ def install_version(version_id, status_callback=None, ssl_verify=False):
         if status_callback: status_callback(f"Downloading version JSON for {version_id}...")
         download_file(version_url, version_json_path, f"version JSON ({version_id})", ssl_verify)
 
-    with open(version_json_path, 'r') as f:
-        version_data = json.load(f)
+    version_data = load_version_json(version_id)
 
     parent_id = version_data.get("inheritsFrom")
     parent_data = {}
     if parent_id:
         if status_callback: status_callback(f"Version {version_id} inherits from {parent_id}. Installing parent...")
         install_version(parent_id, status_callback, ssl_verify)
-        parent_json_path = os.path.join(VERSIONS_DIR, parent_id, f"{parent_id}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
+        parent_data = load_version_json(parent_id)
 
     client_info = version_data.get("downloads", {}).get("client")
     if client_info and not os.path.isfile(version_jar_path):
         client_url = client_info.get("url")
         if client_url:
             if status_callback: status_callback(f"Downloading client JAR for {version_id}...")
-            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify)
-
-    libraries = version_data.get("libraries", []) + parent_data.get("libraries", [])
-    total_libs = len(libraries)
-    for i, lib in enumerate(libraries):
-        rules = lib.get("rules", [])
-        allowed = not rules or any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in rules)
-        if not allowed: continue
-
-        artifact = lib.get("downloads", {}).get("artifact")
-        if artifact and artifact.get("path"):
-            lib_path = os.path.join(LIBRARIES_DIR, artifact["path"])
-            if not os.path.isfile(lib_path):
-                lib_url = artifact.get("url") or LIBRARIES_BASE_URL + artifact["path"]
-                if status_callback: status_callback(f"Downloading library {i+1}/{total_libs}: {os.path.basename(lib_path)}")
-                download_file(lib_url, lib_path, f"library ({os.path.basename(lib_path)})", ssl_verify)
-
-        natives_info = lib.get("natives")
-        classifiers = lib.get("downloads", {}).get("classifiers", {})
-        if natives_info and classifiers:
-            native_key = 'natives-osx-arm64' if is_arm64() and 'natives-osx-arm64' in classifiers else natives_info.get('osx', '').replace("${arch}", "64")
-            if native_key in classifiers:
-                native_artifact = classifiers[native_key]
-                native_path = os.path.join(LIBRARIES_DIR, native_artifact["path"])
-                if not os.path.isfile(native_path):
-                    native_url = native_artifact.get("url") or LIBRARIES_BASE_URL + native_artifact["path"]
-                    if status_callback: status_callback(f"Downloading native library {i+1}/{total_libs}: {os.path.basename(native_path)}")
-                    download_file(native_url, native_path, f"native library ({os.path.basename(native_path)})", ssl_verify)
-                natives_dir = os.path.join(version_folder, "natives")
-                os.makedirs(natives_dir, exist_ok=True)
-                with zipfile.ZipFile(native_path, 'r') as zf:
-                    for member in zf.namelist():
-                        if not member.startswith("META-INF/") and not member.endswith('/'):
-                            zf.extract(member, natives_dir)
+            download_file(client_url, version_jar_path, f"client JAR ({version_id})", ssl_verify, client_info.get("sha1"))
+
+    lib_jobs = []
+    native_paths = []
+    for entry in flatten_libraries(version_data, parent_data):
+        if entry.path and not os.path.isfile(entry.path):
+            lib_jobs.append((entry.url, entry.path, f"library ({os.path.basename(entry.path)})", entry.sha1))
+        if entry.native_path:
+            if not os.path.isfile(entry.native_path):
+                lib_jobs.append((entry.native_url, entry.native_path, f"native library ({os.path.basename(entry.native_path)})", entry.native_sha1))
+            native_paths.append(entry.native_path)
+
+    if lib_jobs and status_callback: status_callback(f"Downloading {len(lib_jobs)} libraries for {version_id}...")
+    download_many(lib_jobs, "library", status_callback, ssl_verify)
+
+    if native_paths:
+        natives_dir = os.path.join(version_folder, "natives")
+        os.makedirs(natives_dir, exist_ok=True)
+        for native_path in native_paths:
+            extract_natives(native_path, natives_dir)
 
     asset_index_info = version_data.get("assetIndex") or parent_data.get("assetIndex")
     if asset_index_info:
         idx_id = asset_index_info["id"]
         idx_url = asset_index_info["url"]
         idx_dest = os.path.join(ASSETS_DIR, "indexes", f"{idx_id}.json")
-        if not os.path.isfile(idx_dest):
+        idx_size = asset_index_info.get("size")
+        if not os.path.isfile(idx_dest) or (idx_size and os.path.getsize(idx_dest) != idx_size):
+            # A local copy of the wrong size must not be revalidated (a 304 would keep it), so
+            # drop its saved validators and force a full, SHA-1 checked download
+            if os.path.exists(idx_dest + ".etag"):
+                os.remove(idx_dest + ".etag")
             if status_callback: status_callback(f"Downloading asset index {idx_id}...")
-            download_file(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify)
+            download_file_cached(idx_url, idx_dest, f"asset index ({idx_id})", ssl_verify, asset_index_info.get("sha1"))
 
-        with open(idx_dest, 'r') as f:
-            idx_data = json.load(f)
-        total_assets = len(idx_data["objects"])
-        assets_downloaded = 0
-        for asset_name, info in idx_data["objects"].items():
+        asset_jobs = []
+        total_assets = 0
+        present = {}  # objects/xx prefix -> names already on disk, read with one scandir each
+        for asset_name, info in iter_asset_index(idx_dest):
+            total_assets += 1
             hash_val = info.get("hash")
             if hash_val:
                 subdir = hash_val[:2]
-                asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
-                if not os.path.isfile(asset_path):
-                    assets_downloaded += 1
-                    if status_callback: status_callback(f"Downloading asset {assets_downloaded}/{total_assets}: {asset_name}")
-                    download_file(ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", ssl_verify)
+                if subdir not in present:
+                    present[subdir] = list_object_dir(subdir)
+                if hash_val not in present[subdir]:
+                    asset_path = os.path.join(ASSETS_DIR, "objects", subdir, hash_val)
+                    asset_jobs.append((ASSET_BASE_URL + f"{subdir}/{hash_val}", asset_path, f"asset ({hash_val[:8]})", hash_val))
+        if asset_jobs and status_callback: status_callback(f"Downloading {len(asset_jobs)}/{total_assets} assets...")
+        # Assets share at most 256 objects/xx directories; create them once up front
+        for subdir in {os.path.dirname(job[1]) for job in asset_jobs}:
+            os.makedirs(subdir, exist_ok=True)
+        download_many(asset_jobs, "asset", status_callback, ssl_verify, skip_mkdir=True)
 
     # TLauncher Skin Patch
     try:
-        with open(version_json_path, 'r+') as vf:
-            data = json.load(vf)
-            if not data.get("skinVersion", False):
-                data["skinVersion"] = True
-                vf.seek(0)
-                json.dump(data, vf, indent=4)
-                vf.truncate()
-                print(f"Patched {version_id}.json with skinVersion=true")
+        if not version_data.get("skinVersion", False):
+            with open(version_json_path, 'w') as vf:
+                json.dump({**version_data, "skinVersion": True}, vf, indent=4)
+            print(f"Patched {version_id}.json with skinVersion=true")
     except Exception as e:
         print(f"Warning: Could not set skinVersion in {version_id}.json - {e}")
 
@@ -319,6 +640,8 @@ def setup_tlauncher_cosmetics(account, status_callback=None, ssl_verify=False):
     if status_callback: status_callback(f"TLauncher cosmetics setup complete for {account['username']}")
 
 # --- Game Launch Logic ---
+_PLACEHOLDER_RE = re.compile(r'\$\{[^}]+\}')
+
 def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=None, server_ip=None, port=None, 
                status_callback=None, use_rosetta=False, lunar_client=False, ssl_verify=False):
     if status_callback: status_callback(f"Preparing to launch {version_id}...")
@@ -330,38 +653,33 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
     install_version(version_id, status_callback, ssl_verify)
 
     version_folder = os.path.join(VERSIONS_DIR, version_id)
-    version_json_path = os.path.join(version_folder, f"{version_id}.json")
-    with open(version_json_path, 'r') as f:
-        vdata = json.load(f)
+    vdata = load_version_json(version_id)
 
     main_class = vdata.get("mainClass")
-    classpath = set()
+    classpath = []
+    seen_paths = set()
     natives_dir_absolute = os.path.abspath(os.path.join(version_folder, "natives"))
     parent_data = {}
     if vdata.get("inheritsFrom"):
-        parent_json_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.json")
-        with open(parent_json_path, 'r') as pf:
-            parent_data = json.load(pf)
+        parent_data = load_version_json(vdata["inheritsFrom"])
         main_class = main_class or parent_data.get("mainClass")
 
-    for lib in vdata.get("libraries", []) + parent_data.get("libraries", []):
-        if any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in lib.get("rules", [])) or not lib.get("rules"):
-            artifact = lib.get("downloads", {}).get("artifact")
-            if artifact and artifact.get("path"):
-                lib_file = os.path.join(LIBRARIES_DIR, artifact["path"])
-                if os.path.isfile(lib_file):
-                    classpath.add(os.path.abspath(lib_file))
+    for entry in flatten_libraries(vdata, parent_data):
+        if entry.path and entry.path not in seen_paths:
+            seen_paths.add(entry.path)
+            if os.path.isfile(entry.path):
+                classpath.append(entry.path)
 
     version_jar_path = os.path.join(version_folder, f"{version_id}.jar")
     if os.path.isfile(version_jar_path):
-        classpath.add(os.path.abspath(version_jar_path))
+        classpath.append(os.path.abspath(version_jar_path))
     elif vdata.get("inheritsFrom"):
         parent_jar_path = os.path.join(VERSIONS_DIR, vdata["inheritsFrom"], f"{vdata['inheritsFrom']}.jar")
         if os.path.isfile(parent_jar_path):
-            classpath.add(os.path.abspath(parent_jar_path))
+            classpath.append(os.path.abspath(parent_jar_path))
 
     jvm_args = [f"-Xmx{ram_mb}M", f"-Djava.library.path={natives_dir_absolute}"]
-    if is_arm64():
+    if IS_ARM64:
         jvm_args.extend(["-XX:+UseG1GC", "-XX:MaxGCPauseMillis=200", "-XX:ParallelGCThreads=4", "-Dapple.awt.application.name=Cat Client"])
     if lunar_client:
         jvm_args.extend(["-Dfml.ignoreInvalidMinecraftCertificates=true", "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=true"])
@@ -388,15 +706,21 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
         "${launcher_version}": "0.1.0"
     }
 
+    def subst(arg):
+        # Unknown placeholders are left as-is; most arguments have none at all
+        if "${" not in arg:
+            return arg
+        return _PLACEHOLDER_RE.sub(lambda m: replacements.get(m.group(0), m.group(0)), arg)
+
     for arg in raw_jvm_args:
         if isinstance(arg, str):
-            jvm_args.append(arg.format(**replacements))
+            jvm_args.append(subst(arg))
         elif isinstance(arg, dict) and any(rule["action"] == "allow" and (not rule.get("os") or rule["os"].get("name") == "osx") for rule in arg["rules"]):
             value = arg["value"]
-            jvm_args.extend([v.format(**replacements)] if isinstance(value, list) else [value.format(**replacements)])
+            jvm_args.extend([subst(v) for v in value] if isinstance(value, list) else [subst(value)])
 
     jvm_args.extend(["-cp", os.pathsep.join(classpath)])
-    game_args = [arg.format(**replacements) if isinstance(arg, str) else arg["value"][0].format(**replacements) for arg in raw_game_args if isinstance(arg, str) or (isinstance(arg, dict) and "value" in arg)]
+    game_args = [subst(arg) if isinstance(arg, str) else subst(arg["value"][0]) for arg in raw_game_args if isinstance(arg, str) or (isinstance(arg, dict) and "value" in arg)]
     if server_ip:
         game_args.extend(["--server", server_ip])
         if port: game_args.extend(["--port", str(port)])
@@ -408,6 +732,25 @@ def launch_game(version_id, account, ram_mb=1024, java_path="java", game_dir=Non
     if status_callback: status_callback(f"Launching Minecraft {version_id}...")
     subprocess.Popen(command, cwd=effective_game_dir)
 
+def jdk_version(java_path):
+    # Sort key for a bundled JDK launcher: JAVA_VERSION from Contents/Home/release, else the
+    # numbers in the bundle name; "1.8.0" counts as 8 so it sorts below 17 and 21
+    home = os.path.dirname(os.path.dirname(java_path))
+    version = ""
+    try:
+        with open(os.path.join(home, "release"), 'r') as f:
+            match = re.search(r'^JAVA_VERSION="([^"]+)"', f.read(), re.M)
+        if match:
+            version = match.group(1)
+    except OSError:
+        pass
+    if not version:
+        version = os.path.basename(os.path.dirname(os.path.dirname(home)))
+    numbers = [int(n) for n in re.findall(r"\d+", version)]
+    if len(numbers) > 1 and numbers[0] == 1:
+        numbers = numbers[1:]
+    return tuple(numbers)
+
 # --- GUI ---
 class M1LauncherApp:
     def __init__(self, root):
@@ -422,7 +765,7 @@ class M1LauncherApp:
         ssl_frame.pack(fill="x", padx=10, pady=5)
         ttk.Checkbutton(ssl_frame, text="Verify SSL Certificates (Disable if you have SSL errors)", 
                         variable=self.ssl_verify_var).grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        ttk.Button(ssl_frame, text="Load Version Manifest", command=self.load_manifest).grid(row=0, column=1, padx=5, pady=2)
+        ttk.Button(ssl_frame, text="Load Version Manifest", command=lambda: self.load_manifest(max_age=0)).grid(row=0, column=1, padx=5, pady=2)
         ttk.Label(ssl_frame, text="Note: macOS often has SSL certificate issues with Python. If downloads fail, uncheck this option.",
                   wraplength=500, foreground="red").grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=2)
 
@@ -432,8 +775,8 @@ class M1LauncherApp:
         ttk.Checkbutton(m1_frame, text="Use Rosetta 2 (x86_64 mode)", variable=self.use_rosetta_var).grid(row=0, column=0, sticky="w", padx=5, pady=2)
         self.lunar_client_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(m1_frame, text="Lunar Client Compatibility Mode", variable=self.lunar_client_var).grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(m1_frame, text=f"Detected CPU architecture: {'Apple Silicon (ARM64)' if is_arm64() else 'Intel/Rosetta (x86_64)'}").grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(m1_frame, text=f"Rosetta 2: {'Yes (active)' if detect_rosetta() else 'Yes (installed)' if is_arm64() else 'N/A (Intel Mac)'}").grid(row=3, column=0, sticky="w", padx=5, pady=2)
+        ttk.Label(m1_frame, text=f"Detected CPU architecture: {'Apple Silicon (ARM64)' if IS_ARM64 else 'Intel/Rosetta (x86_64)'}").grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        ttk.Label(m1_frame, text=f"Rosetta 2: {'Yes (active)' if HAS_ROSETTA else 'Yes (installed)' if IS_ARM64 else 'N/A (Intel Mac)'}").grid(row=3, column=0, sticky="w", padx=5, pady=2)
 
         acct_frame = ttk.LabelFrame(root, text="Accounts")
         acct_frame.pack(fill="x", padx=10, pady=5)
@@ -488,7 +831,8 @@ class M1LauncherApp:
         self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Frame(root, relief=tk.SUNKEN, padding="2 2 2 2")
         status_bar.pack(side=tk.BOTTOM, fill="x")
-        ttk.Label(status_bar, textvariable=self.status_var).pack(side=tk.LEFT)
+        self.status_label = ttk.Label(status_bar, textvariable=self.status_var)
+        self.status_label.pack(side=tk.LEFT)
 
         launch_frame = ttk.Frame(root)
         launch_frame.pack(pady=15)
@@ -505,10 +849,10 @@ class M1LauncherApp:
         self.refresh_account_list()
         self.load_manifest()
 
-    def load_manifest(self):
+    def load_manifest(self, max_age=MANIFEST_MAX_AGE):
         self.set_status("Loading version manifest...", "blue")
         try:
-            self.version_manifest = load_version_manifest(self.ssl_verify_var.get())
+            self.version_manifest = load_version_manifest(self.ssl_verify_var.get(), max_age)
             self.populate_version_list()
             self.set_status("Version manifest loaded successfully.", "green")
         except Exception as e:
@@ -519,7 +863,8 @@ class M1LauncherApp:
         try:
             release_versions = sorted([v['id'] for v in self.version_manifest['versions'] if v['type'] == 'release'], reverse=True)
             snapshot_versions = sorted([v['id'] for v in self.version_manifest['versions'] if v['type'] == 'snapshot'], reverse=True)
-            custom_versions = [item for item in os.listdir(VERSIONS_DIR) if os.path.isdir(os.path.join(VERSIONS_DIR, item)) and item not in all_versions]
+            with os.scandir(VERSIONS_DIR) as it:
+                custom_versions = [e.name for e in it if e.name not in all_versions and e.is_dir()]
             self.popular_modpacks = {
                 "RLCraft (Modpack)": "rlcraft",
                 "All the Mods 9 (Modpack)": "all-the-mods-9-atm9",
@@ -548,14 +893,15 @@ class M1LauncherApp:
             "/opt/homebrew/opt/java/bin/java",
             "/usr/local/opt/java/bin/java",
         ]
-        if is_arm64():
+        if IS_ARM64:
             for path in java_locations:
                 if os.path.isfile(path):
                     return path
                 elif os.path.isdir(path):
-                    for root, _, files in os.walk(path):
-                        if "bin" in root and "java" in files:
-                            return os.path.join(root, "java")
+                    # A JDK bundle keeps its launcher at a fixed depth; highest Java version first
+                    for java in sorted(glob.glob(os.path.join(path, "*", "Contents", "Home", "bin", "java")), key=jdk_version, reverse=True):
+                        if os.path.isfile(java):
+                            return java
         return shutil.which("java") or "java"
 
     def browse_java(self):
@@ -569,13 +915,7 @@ class M1LauncherApp:
 
     def _update_status_ui(self, message, color):
         self.status_var.set(message)
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Frame) and widget.cget('relief') == tk.SUNKEN:
-                for label in widget.winfo_children():
-                    if isinstance(label, ttk.Label):
-                        label.config(foreground=color)
-                        break
-                break
+        self.status_label.config(foreground=color)
 
     def on_add_account(self):
         acc_type = self.acct_type_var.get()
@@ -671,9 +1011,8 @@ class M1LauncherApp:
             game_directory = None
             if is_modpack:
                 self.set_status(f"Installing modpack '{item_to_launch}'...", "blue")
-                messagebox.showinfo("Modpack Support", "Modpack installation not fully implemented yet.")
+                self.root.after(0, messagebox.showinfo, "Modpack Support", "Modpack installation not fully implemented yet.")
                 self.set_status("Ready", "black")
-                self.root.after(0, self.launch_btn.config, {"state": "normal"})
                 return
             else:
                 final_version_id = item_to_launch